@@ -6,11 +6,64 @@ Interactive Streamlit demo with visual components
 
 import streamlit as st
 import json
+import os
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
+from typing import List
 
-from rfq_parser import RFQParser, Direction, AssetClass, Urgency, CPP_AVAILABLE
+import pandas as pd
+
+from rfq_parser import RFQParser, ParsedRFQ, Direction, AssetClass, Urgency, CPP_AVAILABLE
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Batches at least this large may be routed through the Mistral Batch API
+BATCH_API_MIN_LINES = 20
+
+# LLM batches up to this size are row-marshaled into multi-RFQ prompts
+MARSHAL_MAX_LINES = 16
+
+# Per-row LLM batches refresh the results table every this many rows
+STREAM_REFRESH_ROWS = 25
+
+# Sample RFQs offered in the sidebar
+SAMPLE_RFQS = {
+    "FX Spot (Buy)": "Buy 10MM EUR/USD spot",
+    "FX Forward": "Need a price on 5M GBP/USD 3M forward",
+    "Two-Way": "Can I get a two-way on 50MM USD/JPY?",
+    "Urgent Request": "URGENT: Sell 25MM EUR/USD ASAP!",
+    "Complex RFQ": "Hi, looking to buy 100 MIO EURUSD 6 months outright, value date IMM Dec",
+    "IRS (C++ Pricing)": "Buy 10MM USD IRS 5Y paying fixed at 5.25%",
+    "Swaption (C++ Pricing)": "Sell 50MM USD swaption 3Y strike 4.5%"
+}
+_SAMPLE_OPTIONS = [""] + list(SAMPLE_RFQS)
+
+# (label, ParsedRFQ.to_dict() key) rows of the "Parsed Fields" panel
+_FIELD_SPECS = (
+    ("Instrument", "instrument"),
+    ("Currency Pair", "currency_pair"),
+    ("Tenor", "tenor"),
+    ("Settlement Date", "settlement_date"),
+    ("Strike", "strike"),
+    ("Urgency", "urgency"),
+    ("Client", "client_name"),
+)
+
+_DIRECTION_COLORS = {
+    Direction.BUY: "#28a745",
+    Direction.SELL: "#dc3545",
+    Direction.TWO_WAY: "#007bff",
+    Direction.UNKNOWN: "#6c757d"
+}
+
+# Indexed by the number of confidence thresholds (0.5, 0.8) a score meets
+_CONFIDENCE_COLORS = (
+    "#dc3545",  # Red
+    "#ffc107",  # Yellow
+    "#28a745",  # Green
+)
 
 # Page configuration
 st.set_page_config(
@@ -20,77 +73,240 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better visuals
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1E3A5F;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-    }
-    .success-box {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        border: 1px solid #ffeeba;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .json-output {
-        background-color: #f8f9fa;
-        border: 1px solid #e9ecef;
-        border-radius: 5px;
-        padding: 1rem;
-        font-family: monospace;
-        font-size: 0.9rem;
-    }
-    .direction-buy { color: #28a745; font-weight: bold; }
-    .direction-sell { color: #dc3545; font-weight: bold; }
-    .direction-twoway { color: #007bff; font-weight: bold; }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_data
+def _css() -> str:
+    """Custom CSS for better visuals, read once from static/styles.css"""
+    return (STATIC_DIR / 'styles.css').read_text()
+
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 
 def get_direction_color(direction: Direction) -> str:
     """Get color class for direction"""
-    colors = {
-        Direction.BUY: "#28a745",
-        Direction.SELL: "#dc3545",
-        Direction.TWO_WAY: "#007bff",
-        Direction.UNKNOWN: "#6c757d"
-    }
-    return colors.get(direction, "#6c757d")
+    return _DIRECTION_COLORS.get(direction, "#6c757d")
+
+
+def _display_value(value) -> str:
+    """Format a ParsedRFQ.to_dict() value for the details panel"""
+    return str(value) if value else "—"
 
 
 def get_confidence_color(score: float) -> str:
     """Get color based on confidence score"""
-    if score >= 0.8:
-        return "#28a745"  # Green
-    elif score >= 0.5:
-        return "#ffc107"  # Yellow
-    else:
-        return "#dc3545"  # Red
+    # Each threshold crossed moves one step up the red/yellow/green table
+    return _CONFIDENCE_COLORS[(score >= 0.5) + (score >= 0.8)]
+
+
+@st.cache_resource
+def _get_parser(api_key: str, use_llm: bool) -> RFQParser:
+    """Build one RFQParser per (api_key, use_llm) and reuse it across reruns"""
+    return RFQParser(api_key=api_key or None, use_llm=use_llm)
+
+
+@st.cache_resource
+def _warm_up() -> None:
+    """Run one throwaway regex parse per server process so the first click is warm"""
+    try:
+        _get_parser("", False).parse("Buy 1MM EURUSD")
+    except Exception:
+        pass
+
+
+if os.getenv("RFQ_WARMUP", "1") == "1":
+    _warm_up()
+
+
+def _truncate(s: str, n: int = 50) -> str:
+    """Shorten s to n characters plus an ellipsis"""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def build_batch_table(results: List[ParsedRFQ]) -> pd.DataFrame:
+    """Build the batch results table with column-wise formatting"""
+    df = pd.DataFrame({
+        "RFQ": pd.Series([r.raw_text for r in results], dtype="object"),
+        "Direction": [r.direction.value for r in results],
+        "Asset": [r.asset_class.value for r in results],
+        "Quantity": pd.Series([r.quantity for r in results], dtype="float64"),
+        "Pair": pd.Series([r.currency_pair for r in results], dtype="object"),
+        "Confidence": pd.Series([r.confidence_score for r in results], dtype="float64"),
+    })
+    # Column-wise equivalent of _truncate()
+    rfq = df["RFQ"].str.slice(0, 50)
+    df["RFQ"] = rfq.where(df["RFQ"].str.len() <= 50, rfq + "...")
+    quantity = df["Quantity"]
+    df["Quantity"] = quantity.map("{:,.0f}".format).where(quantity.fillna(0) != 0, "N/A")
+    pair = df["Pair"].fillna("")
+    df["Pair"] = pair.where(pair != "", "—")
+    df["Confidence"] = df["Confidence"].map("{:.0%}".format)
+    return df
+
+
+@st.cache_data
+def _architecture_markdown() -> str:
+    """Architecture diagram shown in the footer expander"""
+    return """
+        ```
+        ┌─────────────────────────────────────────────────────────────┐
+        │                    RFQ Parser Architecture                  │
+        └─────────────────────────────────────────────────────────────┘
+                                     │
+                                     ▼
+        ┌─────────────────────────────────────────────────────────────┐
+        │                      Input Layer                            │
+        │  • Free-form text (chat, email, voice transcript)           │
+        │  • Batch input support                                      │
+        └─────────────────────────────────────────────────────────────┘
+                                     │
+                          ┌──────────┴──────────┐
+                          ▼                     ▼
+        ┌─────────────────────────┐  ┌─────────────────────────┐
+        │     Mistral LLM         │  │    Regex Fallback       │
+        │  (Primary Parser)       │  │  (Backup Parser)        │
+        │                         │  │                         │
+        │  • Semantic understand. │  │  • Pattern matching     │
+        │  • Context awareness    │  │  • Fast & reliable      │
+        │  • Complex RFQ support  │  │  • No API required      │
+        └─────────────────────────┘  └─────────────────────────┘
+                          │                     │
+                          └──────────┬──────────┘
+                                     ▼
+        ┌─────────────────────────────────────────────────────────────┐
+        │                   ParsedRFQ Object                          │
+        │  • Direction (BUY/SELL/TWO_WAY)                             │
+        │  • Asset Class, Instrument, Quantity                        │
+        │  • Tenor, Settlement Date, Strike                           │
+        │  • Confidence Score & Parsing Notes                         │
+        └─────────────────────────────────────────────────────────────┘
+                                     │
+                                     ▼
+        ┌─────────────────────────────────────────────────────────────┐
+        │                    Output Layer                             │
+        │  • JSON serialization                                       │
+        │  • API response                                             │
+        │  • Trading system integration                               │
+        └─────────────────────────────────────────────────────────────┘
+        ```
+        """
+
+
+def _result_panel(result: ParsedRFQ, result_dict: dict, pricing_info, parse_time: float, use_llm: bool):
+    """Render the metric cards, fields, pricing and notes for one parse result"""
+    # Key metrics in cards
+    metric_cols = st.columns(4)
+
+    with metric_cols[0]:
+        direction_color = get_direction_color(result.direction)
+        st.markdown(f"""
+        <div style="background: {direction_color}; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
+            <div style="font-size: 0.8rem; opacity: 0.9;">Direction</div>
+            <div style="font-size: 1.5rem; font-weight: bold;">{result.direction.value}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with metric_cols[1]:
+        st.markdown(f"""
+        <div style="background: #6c757d; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
+            <div style="font-size: 0.8rem; opacity: 0.9;">Asset Class</div>
+            <div style="font-size: 1.2rem; font-weight: bold;">{result.asset_class.value.replace('_', ' ')}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with metric_cols[2]:
+        quantity_display = f"{result.quantity:,.0f}" if result.quantity else "N/A"
+        st.markdown(f"""
+        <div style="background: #17a2b8; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
+            <div style="font-size: 0.8rem; opacity: 0.9;">Quantity</div>
+            <div style="font-size: 1.2rem; font-weight: bold;">{quantity_display}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with metric_cols[3]:
+        conf_color = get_confidence_color(result.confidence_score)
+        st.markdown(f"""
+        <div style="background: {conf_color}; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
+            <div style="font-size: 0.8rem; opacity: 0.9;">Confidence</div>
+            <div style="font-size: 1.5rem; font-weight: bold;">{result.confidence_score:.0%}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.divider()
+
+    # Detailed results
+    detail_cols = st.columns(2)
+
+    with detail_cols[0]:
+        st.subheader("🔍 Parsed Fields")
+
+        fields_data = [(label, _display_value(result_dict[key])) for label, key in _FIELD_SPECS]
+
+        for field, value in fields_data:
+            st.markdown(f"**{field}:** {value}")
+
+    with detail_cols[1]:
+        st.subheader("📋 JSON Output")
+        st.json(result_dict)
+
+    # Pricing Information
+    if pricing_info:
+        st.divider()
+        pricing_label = "💰 C++ Pricing" if pricing_info.get('product_type') == 'Interest Rate Swap' else "💰 Pricing"
+        st.subheader(pricing_label)
+
+        # Warning about default parameters
+        st.warning("⚠️ **Note:** Pricing uses default market parameters for values not specified in the RFQ (see assumptions below)")
+
+        # Display pricing details in a nice format
+        price_cols = st.columns([2, 1])
+
+        with price_cols[0]:
+            st.markdown(f"**Product:** {pricing_info.get('product_type', 'N/A')}")
+            st.markdown(f"**Description:** {pricing_info.get('description', 'N/A')}")
+
+            if pricing_info.get('product_type') == 'Interest Rate Swap':
+                st.markdown(f"**Notional:** {pricing_info['currency']} {pricing_info['notional']:,.0f}")
+                st.markdown(f"**Fixed Rate:** {pricing_info['fixed_rate']}")
+                st.markdown(f"**Floating Index:** {pricing_info['floating_index']}")
+                st.markdown(f"**Tenor:** {pricing_info['tenor']}")
+                st.markdown(f"**Net Payment (180d):** {pricing_info['currency']} {pricing_info['net_payment_180d']:,.2f}")
+
+            elif pricing_info.get('product_type') == 'Swaption':
+                st.markdown(f"**Type:** {pricing_info['type']} Swaption")
+                st.markdown(f"**Exercise:** {pricing_info['exercise_style']}")
+                st.markdown(f"**Notional:** {pricing_info['currency']} {pricing_info['notional']:,.0f}")
+                st.markdown(f"**Strike Rate:** {pricing_info['strike_rate']}")
+                st.markdown(f"**Tenor:** {pricing_info['tenor']}")
+                st.markdown(f"**Expiry:** {pricing_info['expiry']}")
+                st.markdown(f"**Black Price:** {pricing_info['currency']} {pricing_info['black_price']:,.2f}")
+
+        with price_cols[1]:
+            # Display pricing parameters for swaptions
+            if pricing_info.get('product_type') == 'Swaption':
+                st.markdown("**Pricing Assumptions:**")
+                st.markdown("*The following parameters were not specified in the RFQ and use default values:*")
+                st.markdown(f"• **Forward Rate:** {pricing_info['forward_rate']} *(default)*")
+                st.markdown(f"• **Volatility:** {pricing_info['volatility']} *(default)*")
+                st.markdown(f"• **Time to Expiry:** 1 year *(default)*")
+                st.markdown(f"• **Payment Frequency:** Semi-annual *(default)*")
+                st.info("💡 Using C++ Black-76 pricer with full annuity factor calculation")
+            elif pricing_info.get('product_type') == 'Interest Rate Swap':
+                st.markdown("**Pricing Assumptions:**")
+                st.markdown("*The following parameters were not specified in the RFQ:*")
+                st.markdown(f"• **Floating Rate:** 4.5% *(assumed SOFR)*")
+                st.markdown(f"• **Payment Frequency:** Semi-annual fixed, Quarterly floating *(default)*")
+                st.info("💡 Net payment calculated for a 180-day period using C++ swap engine")
+
+    # Parsing notes
+    if result.parsing_notes:
+        st.subheader("📝 Parsing Notes")
+        for note in result.parsing_notes:
+            st.info(note)
+
+    # Performance info
+    cpp_status = "✓ C++ Enabled" if CPP_AVAILABLE else "Python-only"
+    st.caption(f"⏱️ Parsed in {parse_time:.1f}ms | Mode: {'LLM' if use_llm else 'Regex'} | {cpp_status}")
 
 
 def main():
@@ -121,24 +337,11 @@ def main():
         st.divider()
         
         st.header("📝 Sample RFQs")
-        sample_rfqs = {
-            "FX Spot (Buy)": "Buy 10MM EUR/USD spot",
-            "FX Forward": "Need a price on 5M GBP/USD 3M forward",
-            "Two-Way": "Can I get a two-way on 50MM USD/JPY?",
-            "Urgent Request": "URGENT: Sell 25MM EUR/USD ASAP!",
-            "Complex RFQ": "Hi, looking to buy 100 MIO EURUSD 6 months outright, value date IMM Dec",
-            "IRS (C++ Pricing)": "Buy 10MM USD IRS 5Y paying fixed at 5.25%",
-            "Swaption (C++ Pricing)": "Sell 50MM USD swaption 3Y strike 4.5%"
-        }
-        
         selected_sample = st.selectbox(
             "Load sample RFQ",
-            [""] + list(sample_rfqs.keys())
+            _SAMPLE_OPTIONS
         )
     
-    # Initialize parser
-    parser = RFQParser(api_key=api_key, use_llm=use_llm)
-    
     # Main content area
     col1, col2 = st.columns([1, 1])
     
@@ -146,7 +349,7 @@ def main():
         st.header("📥 Input")
         
         # Text input
-        default_text = sample_rfqs.get(selected_sample, "") if selected_sample else ""
+        default_text = SAMPLE_RFQS.get(selected_sample, "") if selected_sample else ""
         rfq_text = st.text_area(
             "Enter RFQ Message",
             value=default_text,
@@ -163,9 +366,12 @@ def main():
     # Process when button clicked
     if parse_button and rfq_text.strip():
         with st.spinner("Parsing RFQ..."):
-            start_time = time.time()
+            # Only build the parser (and LLM client) once there is text to parse
+            parser = _get_parser(api_key or "", use_llm)
+            start_ns = time.perf_counter_ns()
             result = parser.parse(rfq_text)
-            parse_time = (time.time() - start_time) * 1000  # ms
+            parse_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
+            result_dict = result.to_dict()
 
             # Attempt to price with C++ if available
             pricing_info = None
@@ -176,127 +382,7 @@ def main():
                     st.warning(f"Pricing error: {str(e)}")
         
         with output_container:
-            # Key metrics in cards
-            metric_cols = st.columns(4)
-            
-            with metric_cols[0]:
-                direction_color = get_direction_color(result.direction)
-                st.markdown(f"""
-                <div style="background: {direction_color}; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
-                    <div style="font-size: 0.8rem; opacity: 0.9;">Direction</div>
-                    <div style="font-size: 1.5rem; font-weight: bold;">{result.direction.value}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with metric_cols[1]:
-                st.markdown(f"""
-                <div style="background: #6c757d; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
-                    <div style="font-size: 0.8rem; opacity: 0.9;">Asset Class</div>
-                    <div style="font-size: 1.2rem; font-weight: bold;">{result.asset_class.value.replace('_', ' ')}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with metric_cols[2]:
-                quantity_display = f"{result.quantity:,.0f}" if result.quantity else "N/A"
-                st.markdown(f"""
-                <div style="background: #17a2b8; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
-                    <div style="font-size: 0.8rem; opacity: 0.9;">Quantity</div>
-                    <div style="font-size: 1.2rem; font-weight: bold;">{quantity_display}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with metric_cols[3]:
-                conf_color = get_confidence_color(result.confidence_score)
-                st.markdown(f"""
-                <div style="background: {conf_color}; padding: 1rem; border-radius: 10px; text-align: center; color: white;">
-                    <div style="font-size: 0.8rem; opacity: 0.9;">Confidence</div>
-                    <div style="font-size: 1.5rem; font-weight: bold;">{result.confidence_score:.0%}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.divider()
-            
-            # Detailed results
-            detail_cols = st.columns(2)
-            
-            with detail_cols[0]:
-                st.subheader("🔍 Parsed Fields")
-                
-                fields_data = [
-                    ("Instrument", result.instrument or "—"),
-                    ("Currency Pair", result.currency_pair or "—"),
-                    ("Tenor", result.tenor or "—"),
-                    ("Settlement Date", result.settlement_date or "—"),
-                    ("Strike", str(result.strike) if result.strike else "—"),
-                    ("Urgency", result.urgency.value),
-                    ("Client", result.client_name or "—"),
-                ]
-                
-                for field, value in fields_data:
-                    st.markdown(f"**{field}:** {value}")
-            
-            with detail_cols[1]:
-                st.subheader("📋 JSON Output")
-                st.json(result.to_dict())
-            
-            # Pricing Information
-            if pricing_info:
-                st.divider()
-                pricing_label = "💰 C++ Pricing" if pricing_info.get('product_type') == 'Interest Rate Swap' else "💰 Pricing"
-                st.subheader(pricing_label)
-
-                # Warning about default parameters
-                st.warning("⚠️ **Note:** Pricing uses default market parameters for values not specified in the RFQ (see assumptions below)")
-
-                # Display pricing details in a nice format
-                price_cols = st.columns([2, 1])
-
-                with price_cols[0]:
-                    st.markdown(f"**Product:** {pricing_info.get('product_type', 'N/A')}")
-                    st.markdown(f"**Description:** {pricing_info.get('description', 'N/A')}")
-
-                    if pricing_info.get('product_type') == 'Interest Rate Swap':
-                        st.markdown(f"**Notional:** {pricing_info['currency']} {pricing_info['notional']:,.0f}")
-                        st.markdown(f"**Fixed Rate:** {pricing_info['fixed_rate']}")
-                        st.markdown(f"**Floating Index:** {pricing_info['floating_index']}")
-                        st.markdown(f"**Tenor:** {pricing_info['tenor']}")
-                        st.markdown(f"**Net Payment (180d):** {pricing_info['currency']} {pricing_info['net_payment_180d']:,.2f}")
-
-                    elif pricing_info.get('product_type') == 'Swaption':
-                        st.markdown(f"**Type:** {pricing_info['type']} Swaption")
-                        st.markdown(f"**Exercise:** {pricing_info['exercise_style']}")
-                        st.markdown(f"**Notional:** {pricing_info['currency']} {pricing_info['notional']:,.0f}")
-                        st.markdown(f"**Strike Rate:** {pricing_info['strike_rate']}")
-                        st.markdown(f"**Tenor:** {pricing_info['tenor']}")
-                        st.markdown(f"**Expiry:** {pricing_info['expiry']}")
-                        st.markdown(f"**Black Price:** {pricing_info['currency']} {pricing_info['black_price']:,.2f}")
-
-                with price_cols[1]:
-                    # Display pricing parameters for swaptions
-                    if pricing_info.get('product_type') == 'Swaption':
-                        st.markdown("**Pricing Assumptions:**")
-                        st.markdown("*The following parameters were not specified in the RFQ and use default values:*")
-                        st.markdown(f"• **Forward Rate:** {pricing_info['forward_rate']} *(default)*")
-                        st.markdown(f"• **Volatility:** {pricing_info['volatility']} *(default)*")
-                        st.markdown(f"• **Time to Expiry:** 1 year *(default)*")
-                        st.markdown(f"• **Payment Frequency:** Semi-annual *(default)*")
-                        st.info("💡 Using C++ Black-76 pricer with full annuity factor calculation")
-                    elif pricing_info.get('product_type') == 'Interest Rate Swap':
-                        st.markdown("**Pricing Assumptions:**")
-                        st.markdown("*The following parameters were not specified in the RFQ:*")
-                        st.markdown(f"• **Floating Rate:** 4.5% *(assumed SOFR)*")
-                        st.markdown(f"• **Payment Frequency:** Semi-annual fixed, Quarterly floating *(default)*")
-                        st.info("💡 Net payment calculated for a 180-day period using C++ swap engine")
-
-            # Parsing notes
-            if result.parsing_notes:
-                st.subheader("📝 Parsing Notes")
-                for note in result.parsing_notes:
-                    st.info(note)
-
-            # Performance info
-            cpp_status = "✓ C++ Enabled" if CPP_AVAILABLE else "Python-only"
-            st.caption(f"⏱️ Parsed in {parse_time:.1f}ms | Mode: {'LLM' if use_llm else 'Regex'} | {cpp_status}")
+            _result_panel(result, result_dict, pricing_info, parse_time, use_llm)
     
     elif parse_button:
         st.warning("Please enter an RFQ message to parse.")
@@ -312,71 +398,46 @@ def main():
             placeholder="Buy 10MM EURUSD\nSell 5MM GBPUSD\nTwo-way on 20MM USDJPY"
         )
         
+        use_batch_api = st.checkbox(
+            "Use Mistral Batch API",
+            value=False,
+            disabled=not use_llm,
+            help=f"Submit batches of {BATCH_API_MIN_LINES}+ RFQs as a single Mistral batch job"
+        )
+
         if st.button("Parse Batch", use_container_width=True):
             lines = [line.strip() for line in batch_input.split('\n') if line.strip()]
             if lines:
-                results = parser.parse_batch(lines)
+                parser = _get_parser(api_key or "", use_llm)
+                table = st.empty()
+                if use_batch_api and parser.use_llm and len(lines) >= BATCH_API_MIN_LINES:
+                    progress = st.progress(0.0, text="Waiting for Mistral batch job...")
+                    results = parser.parse_batch_via_mistral_api(
+                        lines,
+                        progress_callback=lambda done, total: progress.progress(
+                            done / total, text=f"Batch job: {done}/{total} RFQs parsed"
+                        )
+                    )
+                elif parser.use_llm and 1 < len(lines) <= MARSHAL_MAX_LINES:
+                    # Small batches: several RFQs per prompt instead of one call each
+                    results = parser.parse_marshaled(lines)
+                elif parser.use_llm:
+                    # LLM calls overlap in the parser's thread pool; show rows as they arrive
+                    results = []
+                    for i, result in enumerate(parser.iter_parse_batch(lines, max_workers=16), 1):
+                        results.append(result)
+                        if i % STREAM_REFRESH_ROWS == 0 and i < len(lines):
+                            table.dataframe(build_batch_table(results), use_container_width=True)
+                else:
+                    results = parser.parse_batch(lines)
                 
                 # Display as table
-                table_data = []
-                for r in results:
-                    table_data.append({
-                        "RFQ": r.raw_text[:50] + "..." if len(r.raw_text) > 50 else r.raw_text,
-                        "Direction": r.direction.value,
-                        "Asset": r.asset_class.value,
-                        "Quantity": f"{r.quantity:,.0f}" if r.quantity else "N/A",
-                        "Pair": r.currency_pair or "—",
-                        "Confidence": f"{r.confidence_score:.0%}"
-                    })
-                
-                st.dataframe(table_data, use_container_width=True)
+                table.dataframe(build_batch_table(results), use_container_width=True)
     
     # Footer with architecture diagram
     st.divider()
     with st.expander("🏗️ Architecture Overview"):
-        st.markdown("""
-        ```
-        ┌─────────────────────────────────────────────────────────────┐
-        │                    RFQ Parser Architecture                  │
-        └─────────────────────────────────────────────────────────────┘
-                                     │
-                                     ▼
-        ┌─────────────────────────────────────────────────────────────┐
-        │                      Input Layer                            │
-        │  • Free-form text (chat, email, voice transcript)           │
-        │  • Batch input support                                      │
-        └─────────────────────────────────────────────────────────────┘
-                                     │
-                          ┌──────────┴──────────┐
-                          ▼                     ▼
-        ┌─────────────────────────┐  ┌─────────────────────────┐
-        │     Mistral LLM         │  │    Regex Fallback       │
-        │  (Primary Parser)       │  │  (Backup Parser)        │
-        │                         │  │                         │
-        │  • Semantic understand. │  │  • Pattern matching     │
-        │  • Context awareness    │  │  • Fast & reliable      │
-        │  • Complex RFQ support  │  │  • No API required      │
-        └─────────────────────────┘  └─────────────────────────┘
-                          │                     │
-                          └──────────┬──────────┘
-                                     ▼
-        ┌─────────────────────────────────────────────────────────────┐
-        │                   ParsedRFQ Object                          │
-        │  • Direction (BUY/SELL/TWO_WAY)                             │
-        │  • Asset Class, Instrument, Quantity                        │
-        │  • Tenor, Settlement Date, Strike                           │
-        │  • Confidence Score & Parsing Notes                         │
-        └─────────────────────────────────────────────────────────────┘
-                                     │
-                                     ▼
-        ┌─────────────────────────────────────────────────────────────┐
-        │                    Output Layer                             │
-        │  • JSON serialization                                       │
-        │  • API response                                             │
-        │  • Trading system integration                               │
-        └─────────────────────────────────────────────────────────────┘
-        ```
-        """)
+        st.markdown(_architecture_markdown())
 
 
 if __name__ == "__main__":
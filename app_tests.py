@@ -197,11 +197,13 @@ Sell 5MM GBPUSD
         lines = [line.strip() for line in batch_input.split('\n') if line.strip()]
         results = parser.parse_batch(lines)
         
+        from app import _truncate
+        
         # Format as table data (same as app.py)
         table_data = []
         for r in results:
             table_data.append({
-                "RFQ": r.raw_text[:50] + "..." if len(r.raw_text) > 50 else r.raw_text,
+                "RFQ": _truncate(r.raw_text),
                 "Direction": r.direction.value,
                 "Asset": r.asset_class.value,
                 "Quantity": f"{r.quantity:,.0f}" if r.quantity else "N/A",
@@ -214,6 +216,39 @@ Sell 5MM GBPUSD
         assert table_data[0]["Pair"] == "EUR/USD"
 
 
+class TestBuildBatchTable:
+    """Test the vectorized batch results table"""
+    
+    @pytest.fixture
+    def parser(self):
+        return RFQParser(use_llm=False)
+    
+    def test_matches_row_by_row_formatting(self, parser):
+        """Vectorized table should match the per-row formatting"""
+        from app import build_batch_table, _truncate
+        lines = ["Buy 10MM EURUSD", "hello", "Sell 2.5MM GBP/USD " + "x" * 60]
+        results = parser.parse_batch(lines)
+        
+        expected = [
+            {
+                "RFQ": _truncate(r.raw_text),
+                "Direction": r.direction.value,
+                "Asset": r.asset_class.value,
+                "Quantity": f"{r.quantity:,.0f}" if r.quantity else "N/A",
+                "Pair": r.currency_pair or "—",
+                "Confidence": f"{r.confidence_score:.0%}"
+            }
+            for r in results
+        ]
+        
+        assert build_batch_table(results).to_dict("records") == expected
+    
+    def test_empty_results(self):
+        """Empty batch should produce an empty table"""
+        from app import build_batch_table
+        assert len(build_batch_table([])) == 0
+
+
 # =============================================================================
 # OUTPUT FORMATTING TESTS
 # =============================================================================
@@ -290,8 +325,8 @@ class TestOutputFormatting:
         long_rfq = "A" * 100  # 100 character RFQ
         result = parser.parse(long_rfq)
         
-        # Truncation logic from app
-        truncated = result.raw_text[:50] + "..." if len(result.raw_text) > 50 else result.raw_text
+        from app import _truncate
+        truncated = _truncate(result.raw_text)
         
         assert len(truncated) == 53  # 50 chars + "..."
         assert truncated.endswith("...")
@@ -301,7 +336,8 @@ class TestOutputFormatting:
         short_rfq = "Buy 10MM EURUSD"
         result = parser.parse(short_rfq)
         
-        truncated = result.raw_text[:50] + "..." if len(result.raw_text) > 50 else result.raw_text
+        from app import _truncate
+        truncated = _truncate(result.raw_text)
         
         assert truncated == short_rfq
         assert not truncated.endswith("...")
@@ -375,9 +411,9 @@ class TestPerformance:
         
         parser = RFQParser(use_llm=False)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = parser.parse("Buy 10MM EURUSD spot")
-        parse_time = (time.time() - start_time) * 1000  # ms
+        parse_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
         
         # Should complete in under 100ms for regex mode
         assert parse_time < 100, f"Parsing took {parse_time:.1f}ms"
@@ -389,9 +425,9 @@ class TestPerformance:
         parser = RFQParser(use_llm=False)
         rfqs = ["Buy 10MM EURUSD"] * 100
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = parser.parse_batch(rfqs)
-        parse_time = (time.time() - start_time) * 1000  # ms
+        parse_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
         
         assert len(results) == 100
         # Should complete 100 parses in under 1 second
@@ -8,6 +8,7 @@
 #include "rfq/swaption.hpp"
 #include "rfq/rfq_validator.hpp"
 #include "rfq/thread_safe_queue.hpp"
+#include "rfq/mpmc_queue.hpp"
 
 namespace py = pybind11;
 using namespace rfq;
@@ -410,6 +411,24 @@ PYBIND11_MODULE(rfq_cpp, m) {
         .def("is_shutdown", &ThreadSafeQueue<std::string>::isShutdown)
         .def("restart", &ThreadSafeQueue<std::string>::restart);
 
+    // ========================================================================
+    // LOCK-FREE MPMC QUEUE
+    // ========================================================================
+
+    // Arguments are converted to std::string before the GIL is dropped, so
+    // Python threads can push/pop concurrently inside the C++ ring
+    py::class_<MPMCQueue<std::string>>(m, "MPMCQueue")
+        .def(py::init<size_t>(), py::arg("capacity"))
+        .def("try_push", py::overload_cast<const std::string&>(&MPMCQueue<std::string>::tryPush),
+             py::arg("item"), py::call_guard<py::gil_scoped_release>(),
+             "Try to push item (non-blocking, False if full)")
+        .def("try_pop", &MPMCQueue<std::string>::tryPop,
+             py::call_guard<py::gil_scoped_release>(),
+             "Try to pop item (non-blocking, None if empty)")
+        .def("empty", &MPMCQueue<std::string>::empty)
+        .def("size", &MPMCQueue<std::string>::size)
+        .def("capacity", &MPMCQueue<std::string>::capacity);
+
     // Version info
     m.attr("__version__") = "0.1.0";
 
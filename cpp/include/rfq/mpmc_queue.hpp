@@ -0,0 +1,194 @@
+#pragma once
+
+#include <atomic>
+#include <cstddef>
+#include <memory>
+#include <new>
+#include <optional>
+#include <stdexcept>
+#include <thread>
+#include <type_traits>
+#include <utility>
+
+namespace rfq {
+
+/**
+ * MPMCQueue - Bounded lock-free multi-producer multi-consumer queue
+ *
+ * Ring buffer in the style of rigtorp::MPMCQueue / folly::MPMCQueue:
+ * - Producers and consumers take tickets from two atomic counters
+ *   (head_ for pushes, tail_ for pops), so there is no shared lock
+ * - Each slot carries a "turn" counter; ticket i may only write slot
+ *   i % capacity once the slot's turn says the previous lap was consumed
+ * - Slots and counters are cache-line aligned to avoid false sharing
+ *
+ * Unlike ThreadSafeQueue, contended producers/consumers never serialize
+ * on a mutex; throughput scales with the number of threads until the
+ * ring fills or drains. The trade-off is a fixed capacity and spinning
+ * (with yield) instead of sleeping on a condition variable.
+ */
+template<typename T>
+class MPMCQueue {
+    static_assert(std::is_nothrow_destructible<T>::value,
+                  "MPMCQueue requires a nothrow-destructible element type");
+    // A claimed ticket must always be completed: once a slot is taken its
+    // turn has to advance, so moving an item in or out may not throw
+    static_assert(std::is_nothrow_move_constructible<T>::value,
+                  "MPMCQueue requires a nothrow-move-constructible element type");
+
+public:
+    explicit MPMCQueue(size_t capacity)
+        : capacity_(capacity) {
+        if (capacity_ < 1) {
+            throw std::invalid_argument("MPMCQueue capacity must be at least 1");
+        }
+        // One spare slot keeps the last slot off the next allocation's cache line
+        slots_ = std::make_unique<Slot[]>(capacity_ + 1);
+    }
+
+    // Non-copyable, non-movable (threads hold references to the slots)
+    MPMCQueue(const MPMCQueue&) = delete;
+    MPMCQueue& operator=(const MPMCQueue&) = delete;
+
+    /**
+     * Construct an item and enqueue it, spinning while the queue is full
+     *
+     * The item is built before a ticket is taken, so a throwing
+     * constructor leaves the queue untouched.
+     */
+    template<typename... Args>
+    void emplace(Args&&... args) {
+        T value(std::forward<Args>(args)...);
+        const size_t head = head_.fetch_add(1, std::memory_order_acq_rel);
+        Slot& slot = slots_[index(head)];
+        while (turn(head) * 2 != slot.turn.load(std::memory_order_acquire)) {
+            std::this_thread::yield();
+        }
+        slot.construct(std::move(value));
+        slot.turn.store(turn(head) * 2 + 1, std::memory_order_release);
+    }
+
+    /**
+     * Try to construct and enqueue an item (returns false if full)
+     */
+    template<typename... Args>
+    bool tryEmplace(Args&&... args) {
+        T value(std::forward<Args>(args)...);
+        size_t head = head_.load(std::memory_order_acquire);
+        for (;;) {
+            Slot& slot = slots_[index(head)];
+            if (turn(head) * 2 == slot.turn.load(std::memory_order_acquire)) {
+                if (head_.compare_exchange_strong(head, head + 1)) {
+                    slot.construct(std::move(value));
+                    slot.turn.store(turn(head) * 2 + 1, std::memory_order_release);
+                    return true;
+                }
+            } else {
+                const size_t prev_head = head;
+                head = head_.load(std::memory_order_acquire);
+                if (head == prev_head) {
+                    return false;
+                }
+            }
+        }
+    }
+
+    void push(const T& item) { emplace(item); }
+    void push(T&& item) { emplace(std::move(item)); }
+    bool tryPush(const T& item) { return tryEmplace(item); }
+    bool tryPush(T&& item) { return tryEmplace(std::move(item)); }
+
+    /**
+     * Pop an item, spinning while the queue is empty
+     */
+    T pop() {
+        const size_t tail = tail_.fetch_add(1, std::memory_order_acq_rel);
+        Slot& slot = slots_[index(tail)];
+        while (turn(tail) * 2 + 1 != slot.turn.load(std::memory_order_acquire)) {
+            std::this_thread::yield();
+        }
+        T item = slot.take();
+        slot.turn.store(turn(tail) * 2 + 2, std::memory_order_release);
+        return item;
+    }
+
+    /**
+     * Try to pop an item (non-blocking)
+     * Returns std::nullopt if queue is empty
+     */
+    std::optional<T> tryPop() {
+        size_t tail = tail_.load(std::memory_order_acquire);
+        for (;;) {
+            Slot& slot = slots_[index(tail)];
+            if (turn(tail) * 2 + 1 == slot.turn.load(std::memory_order_acquire)) {
+                if (tail_.compare_exchange_strong(tail, tail + 1)) {
+                    std::optional<T> item(slot.take());
+                    slot.turn.store(turn(tail) * 2 + 2, std::memory_order_release);
+                    return item;
+                }
+            } else {
+                const size_t prev_tail = tail;
+                tail = tail_.load(std::memory_order_acquire);
+                if (tail == prev_tail) {
+                    return std::nullopt;
+                }
+            }
+        }
+    }
+
+    /**
+     * Approximate number of items (exact when no operation is in flight)
+     */
+    size_t size() const noexcept {
+        const auto diff = static_cast<std::ptrdiff_t>(
+            head_.load(std::memory_order_relaxed) - tail_.load(std::memory_order_relaxed));
+        return diff > 0 ? static_cast<size_t>(diff) : 0;
+    }
+
+    bool empty() const noexcept {
+        return size() == 0;
+    }
+
+    size_t capacity() const noexcept {
+        return capacity_;
+    }
+
+private:
+    static constexpr size_t kCacheLineSize = 64;
+
+    struct alignas(kCacheLineSize) Slot {
+        // Even: empty, waiting for lap turn/2 to write. Odd: holds an item.
+        std::atomic<size_t> turn{0};
+        alignas(T) unsigned char storage[sizeof(T)];
+
+        ~Slot() {
+            if (turn.load(std::memory_order_relaxed) & 1) {
+                item().~T();
+            }
+        }
+
+        void construct(T&& value) noexcept {
+            new (&storage) T(std::move(value));
+        }
+
+        T take() {
+            T value = std::move(item());
+            item().~T();
+            return value;
+        }
+
+        T& item() noexcept {
+            return *std::launder(reinterpret_cast<T*>(&storage));
+        }
+    };
+
+    size_t index(size_t ticket) const noexcept { return ticket % capacity_; }
+    size_t turn(size_t ticket) const noexcept { return ticket / capacity_; }
+
+    const size_t capacity_;
+    std::unique_ptr<Slot[]> slots_;
+    alignas(kCacheLineSize) std::atomic<size_t> head_{0};
+    alignas(kCacheLineSize) std::atomic<size_t> tail_{0};
+};
+
+} // namespace rfq
@@ -7,9 +7,12 @@
 #include "rfq/swaption.hpp"
 #include "rfq/rfq_validator.hpp"
 #include "rfq/thread_safe_queue.hpp"
+#include "rfq/mpmc_queue.hpp"
 
 #include <thread>
 #include <chrono>
+#include <memory>
+#include <vector>
 
 using namespace rfq;
 using Catch::Approx;
@@ -540,3 +543,101 @@ TEST_CASE("ThreadSafeQueue - Move semantics", "[thread_safe_queue]") {
     REQUIRE(item.has_value());
     REQUIRE(item.value() == "test");
 }
+
+// ============================================================================
+// MPMCQueue Tests
+// ============================================================================
+
+TEST_CASE("MPMCQueue - Bounded try push/pop", "[mpmc_queue]") {
+    MPMCQueue<std::string> queue(2);
+
+    REQUIRE(queue.capacity() == 2);
+    REQUIRE(queue.tryPush("message1"));
+    REQUIRE(queue.tryPush("message2"));
+    REQUIRE_FALSE(queue.tryPush("message3"));
+    REQUIRE(queue.size() == 2);
+
+    auto item1 = queue.tryPop();
+    REQUIRE(item1.has_value());
+    REQUIRE(item1.value() == "message1");
+    REQUIRE(queue.pop() == "message2");
+
+    REQUIRE_FALSE(queue.tryPop().has_value());
+    REQUIRE(queue.empty());
+}
+
+TEST_CASE("MPMCQueue - Zero capacity rejected", "[mpmc_queue]") {
+    REQUIRE_THROWS_AS(MPMCQueue<int>(0), std::invalid_argument);
+}
+
+TEST_CASE("MPMCQueue - Multiple producers and consumers", "[mpmc_queue]") {
+    MPMCQueue<int> queue(16);
+    const int num_producers = 4;
+    const int num_consumers = 4;
+    const int items_per_producer = 10000;
+    const int total = num_producers * items_per_producer;
+
+    std::atomic<long long> sum{0};
+    std::atomic<int> consumed{0};
+    std::vector<std::thread> threads;
+
+    for (int p = 0; p < num_producers; ++p) {
+        threads.emplace_back([&queue, p, items_per_producer]() {
+            for (int i = 0; i < items_per_producer; ++i) {
+                queue.push(p * items_per_producer + i);
+            }
+        });
+    }
+    for (int c = 0; c < num_consumers; ++c) {
+        threads.emplace_back([&queue, &sum, &consumed, total]() {
+            while (consumed.load() < total) {
+                auto item = queue.tryPop();
+                if (item.has_value()) {
+                    sum.fetch_add(item.value());
+                    consumed.fetch_add(1);
+                }
+            }
+        });
+    }
+    for (auto& t : threads) {
+        t.join();
+    }
+
+    // Every item 0..total-1 delivered exactly once
+    REQUIRE(consumed.load() == total);
+    REQUIRE(sum.load() == static_cast<long long>(total) * (total - 1) / 2);
+    REQUIRE(queue.empty());
+}
+
+TEST_CASE("MPMCQueue - Destroys items left in the ring", "[mpmc_queue]") {
+    auto tracker = std::make_shared<int>(0);
+    {
+        MPMCQueue<std::shared_ptr<int>> queue(4);
+        queue.push(tracker);
+        queue.push(tracker);
+        REQUIRE(tracker.use_count() == 3);
+    }
+    REQUIRE(tracker.use_count() == 1);
+}
+
+TEST_CASE("MPMCQueue - Throwing constructor leaves the ring usable", "[mpmc_queue]") {
+    struct Checked {
+        int value;
+        explicit Checked(int v) : value(v) {
+            if (v < 0) {
+                throw std::invalid_argument("negative");
+            }
+        }
+    };
+
+    MPMCQueue<Checked> queue(1);
+    REQUIRE_THROWS_AS(queue.emplace(-1), std::invalid_argument);
+    REQUIRE_THROWS_AS(queue.tryEmplace(-1), std::invalid_argument);
+    REQUIRE(queue.empty());
+
+    // No ticket was consumed by the failed constructions
+    REQUIRE(queue.tryEmplace(1));
+    REQUIRE(queue.pop().value == 1);
+    queue.emplace(2);
+    REQUIRE(queue.pop().value == 2);
+}
@@ -192,10 +192,64 @@ def example_thread_safe_queue():
     print(f"Queue size after processing: {queue.size()}\n")
 
 
+def example_mpmc_queue():
+    """Example: Lock-free MPMC queue shared by several Python threads"""
+    print("=" * 60)
+    print("EXAMPLE 6: Lock-free MPMCQueue")
+    print("=" * 60)
+
+    import threading
+    import time
+
+    queue = rfq_cpp.MPMCQueue(256)
+    num_producers = 4
+    num_consumers = 4
+    rfqs_per_producer = 2500
+
+    def push(rfq):
+        # try_push releases the GIL; back off while the ring is full
+        while not queue.try_push(rfq):
+            time.sleep(0)
+
+    def producer(producer_id):
+        for i in range(rfqs_per_producer):
+            push(f"Desk {producer_id}: Buy {i + 1}MM EURUSD")
+
+    results = [[] for _ in range(num_consumers)]
+
+    def consumer(consumer_id):
+        local = results[consumer_id]
+        while True:
+            rfq = queue.try_pop()
+            if rfq is None:
+                time.sleep(0)
+            elif not rfq:
+                break  # empty string is the shutdown sentinel
+            else:
+                local.append(rfq)
+
+    producers = [threading.Thread(target=producer, args=(p,)) for p in range(num_producers)]
+    consumers = [threading.Thread(target=consumer, args=(c,)) for c in range(num_consumers)]
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        push("")
+    for thread in consumers:
+        thread.join()
+
+    consumed = [rfq for local in results for rfq in local]
+    print(f"Capacity: {queue.capacity()}")
+    print(f"{num_producers} producers x {rfqs_per_producer} RFQs, {num_consumers} consumers")
+    print(f"Consumed: {len(consumed)} (unique: {len(set(consumed))})")
+    print(f"Queue size after processing: {queue.size()}\n")
+
+
 def example_integration_with_python_parser():
     """Example: Integration with Python RFQ parser"""
     print("=" * 60)
-    print("EXAMPLE 6: Integration with Python Parser")
+    print("EXAMPLE 7: Integration with Python Parser")
     print("=" * 60)
 
     from rfq_parser import RFQParser, CPP_AVAILABLE
@@ -228,6 +282,7 @@ if __name__ == "__main__":
     example_bermudan_swaption()
     example_swap_validator()
     example_thread_safe_queue()
+    example_mpmc_queue()
     example_integration_with_python_parser()
 
     print("=" * 60)
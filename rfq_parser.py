@@ -8,21 +8,31 @@ Single-file version with all classes included.
 """
 
 import json
+import math
+import queue
 import re
-from dataclasses import dataclass, field, asdict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Iterator, Tuple
 from datetime import datetime, date
+import hashlib
+import importlib.util
 import os
+import time
 import uuid
+import weakref
+from functools import lru_cache
+from types import MappingProxyType
 
-# Try importing mistralai - will gracefully handle if not installed
-try:
-    from mistralai import Mistral
-    MISTRAL_AVAILABLE = True
-except ImportError:
-    MISTRAL_AVAILABLE = False
-    Mistral = None
+# mistralai takes hundreds of ms to import, so only check it is installed here;
+# _get_mistral_client imports it on first LLM use (regex-only users never pay)
+MISTRAL_AVAILABLE = importlib.util.find_spec("mistralai") is not None
+Mistral: Any = None
 
 # Try importing C++ extension module
 try:
@@ -32,19 +42,118 @@ except ImportError:
     CPP_AVAILABLE = False
     rfq_cpp = None
 
+# Optional fast JSON codec for ParsedRFQ.to_json and LLM responses
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads if orjson is not None else json.loads
+
+
+# =============================================================================
+# REGEX PATTERNS
+# =============================================================================
+# Compiled once at import so the regex fallback does no pattern work per call
+
+# Units are grouped by scale so match.lastindex indexes _AMOUNT_SCALES directly.
+# Amount patterns only start at the first digit of a run: a start inside the
+# run can't match where the run's first digit failed, and retrying every
+# offset made long digit runs quadratic (20k digits took ~50 s).
+_AMOUNT_RE = re.compile(r'(?<!\d)(\d+(?:\.\d+)?)\s*(?:(K)|(MM|M|MIO|MLN)|(B|BN))?\b', re.IGNORECASE)
+_AMOUNT_SCALES = (0.0, 1.0, 1e3, 1e6, 1e9)  # by lastindex: 1 = no unit
+_TENOR_RE = re.compile(r'\b(\d+)\s*(D|W|M|Y|DAY|WEEK|MONTH|YEAR)S?\b')  # upper-cased text
+_STRIKE_RE = re.compile(r'\bSTRIKE\s+(\d+(?:\.\d+)?)\s*%?')
+_FIXED_RATE_RE = re.compile(r'(?:FIXED|PAYING|AT)\s+(\d+(?:\.\d+)?)\s*%')
+_TENOR_UNITS = {'D': 'D', 'DAY': 'D', 'W': 'W', 'WEEK': 'W',
+                'M': 'M', 'MONTH': 'M', 'Y': 'Y', 'YEAR': 'Y'}
+
+_VALID_CCYS = ('EUR', 'USD', 'GBP', 'JPY', 'CHF', 'AUD', 'NZD', 'CAD',
+               'CNY', 'HKD', 'SGD', 'NOK', 'SEK', 'DKK', 'MXN', 'ZAR')
+# One pass finds the leftmost pair written as EUR/USD, EURUSD or EUR USD;
+# the lookahead rejects a currency paired with itself
+_CCY_ALTERNATION = '|'.join(_VALID_CCYS)
+_CCY_PAIR_RE = re.compile(
+    rf'\b({_CCY_ALTERNATION})(?:/|\s+)?(?!\1\b)({_CCY_ALTERNATION})\b'
+)
+# (currency_pair, instrument) per matched pair; every result shares these strings
+_CCY_PAIR_STRINGS: Dict[Tuple[str, ...], Tuple[str, str]] = {
+    (base, quote): (f"{base}/{quote}", f"{base}{quote}")
+    for base in _VALID_CCYS for quote in _VALID_CCYS if base != quote
+}
+
+# Keyword lookup for the regex fallback. The text is tokenized once and each
+# category is a set intersection, so keywords only match whole words (IRS no
+# longer fires inside FIRST, NOW inside KNOW). Tokens split on hyphens so
+# BUY-SIDE and USD-IRS still hit; TWO-WAY/2-WAY and other multi-word phrases
+# are kept as plain substring checks. The word sets carry the inflections the
+# old substring match picked up for free (BIDDING, OFFERING, CLOSING...).
+_TOKEN_RE = re.compile(r'[A-Z0-9]+')
+_BUY_WORDS = frozenset({'BUY', 'BUYS', 'BUYING', 'BUYER', 'BUYERS',
+                        'BID', 'BIDS', 'BIDDING', 'BIDDER', 'BIDDERS',
+                        'LONG', 'MINE'})
+_SELL_WORDS = frozenset({'SELL', 'SELLS', 'SELLING', 'SELLER', 'SELLERS',
+                         'OFFER', 'OFFERS', 'OFFERED', 'OFFERING',
+                         'SHORT', 'SHORTS', 'SHORTING', 'YOURS'})
+_TWO_WAY_PHRASES = ('TWO-WAY', '2-WAY', 'BOTH SIDES')
+_SWAPTION_WORDS = frozenset({'SWAPTION', 'SWAPTIONS'})
+_IRS_WORDS = frozenset({'IRS', 'SWAP', 'SWAPS'})
+_URGENT_WORDS = frozenset({'URGENT', 'URGENTLY', 'ASAP', 'NOW', 'IMMEDIATELY'})
+_EOD_WORDS = frozenset({'EOD', 'CLOSE', 'CLOSING'})
+# Regex-fallback confidence indexed by the bitmask of the five found fields
+_CONFIDENCE_BY_FIELDS = tuple(mask.bit_count() / 5 for mask in range(1 << 5))
+
+# MockMistralClient keyword scan. The alternation sits inside a lookahead so
+# every position is tried, matching the substring semantics of `word in text`
+# even where keywords overlap.
+_MOCK_PAIRS = ('eurusd', 'gbpusd', 'usdjpy', 'usdchf', 'audusd', 'nzdusd', 'usdcad')
+_MOCK_KEYWORD_RE = re.compile(
+    r'(?=(?P<sell>sell|offer|short)'
+    r'|(?P<buy>buy|bid|long)'
+    r'|(?P<two_way>two-way|2-way|both)'
+    r'|(?P<immediate>urgent|asap|immediately)'
+    r'|(?P<eod>eod|end of day)'
+    r'|(?P<pair>' + '|'.join(f'{p[:3]}/?{p[3:]}' for p in _MOCK_PAIRS) + r'))'
+)
+_MOCK_TENOR_RE = re.compile(r'(?<!\d)(\d+)\s*(m|month|y|year|w|week|d|day)')
+_MOCK_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(mm|m|k|b|mio|bn)?')
+_MOCK_TENOR_UNITS = {'m': 'M', 'month': 'M', 'y': 'Y', 'year': 'Y',
+                     'w': 'W', 'week': 'W', 'd': 'D', 'day': 'D'}
+_MOCK_AMOUNT_MULTIPLIERS = {'k': 1e3, 'm': 1e6, 'mm': 1e6, 'mio': 1e6, 'b': 1e9, 'bn': 1e9}
+
+def _notional_currency(text_upper: str) -> str:
+    """First of _VALID_CCYS standing alone as a word or at either end of the text"""
+    padded = f' {text_upper} '
+    for ccy in _VALID_CCYS:
+        if f' {ccy} ' in padded or text_upper.startswith(ccy) or text_upper.endswith(ccy):
+            return ccy
+    return ""
+
+
+def _parse_quantity(text: str) -> Optional[tuple]:
+    """Return (quantity, unit) for the first amount in text, or None"""
+    match = _AMOUNT_RE.search(text)
+    if not match:
+        return None
+    amount = float(match.group(1))
+    last = match.lastindex or 1
+    if last == 1:
+        return amount, ''
+    return amount * _AMOUNT_SCALES[last], match.group(last).upper()
+
 
 # =============================================================================
 # ENUMS
 # =============================================================================
 
-class Direction(Enum):
+class Direction(str, Enum):
     BUY = "BUY"
     SELL = "SELL"
     TWO_WAY = "TWO_WAY"
     UNKNOWN = "UNKNOWN"
 
 
-class AssetClass(Enum):
+class AssetClass(str, Enum):
     FX_SPOT = "FX_SPOT"
     FX_FORWARD = "FX_FORWARD"
     FX_SWAP = "FX_SWAP"
@@ -58,14 +167,14 @@ class AssetClass(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-class Urgency(Enum):
+class Urgency(str, Enum):
     IMMEDIATE = "IMMEDIATE"
     NORMAL = "NORMAL"
     EOD = "END_OF_DAY"
     UNKNOWN = "UNKNOWN"
 
 
-class UrgencyLevel(Enum):
+class UrgencyLevel(str, Enum):
     """Alternative urgency enum with more granular levels"""
     CRITICAL = "CRITICAL"      # Needs immediate attention
     URGENT = "URGENT"          # ASAP
@@ -77,25 +186,43 @@ class UrgencyLevel(Enum):
     @classmethod
     def from_string(cls, value: str) -> 'UrgencyLevel':
         """Convert string to UrgencyLevel"""
-        mapping = {
-            'critical': cls.CRITICAL,
-            'urgent': cls.URGENT,
-            'asap': cls.URGENT,
-            'immediate': cls.CRITICAL,
-            'high': cls.HIGH,
-            'normal': cls.NORMAL,
-            'low': cls.LOW,
-            'eod': cls.LOW,
-            'end of day': cls.LOW,
-        }
-        return mapping.get(value.lower(), cls.UNKNOWN)
+        return _URGENCY_LEVEL_MAP.get(value.lower(), cls.UNKNOWN)
+
+
+_URGENCY_LEVEL_MAP = {
+    'critical': UrgencyLevel.CRITICAL,
+    'urgent': UrgencyLevel.URGENT,
+    'asap': UrgencyLevel.URGENT,
+    'immediate': UrgencyLevel.CRITICAL,
+    'high': UrgencyLevel.HIGH,
+    'normal': UrgencyLevel.NORMAL,
+    'low': UrgencyLevel.LOW,
+    'eod': UrgencyLevel.LOW,
+    'end of day': UrgencyLevel.LOW,
+}
+
+
+def _enum_lookup(enum_cls: Any) -> Dict[str, Any]:
+    """Map member names and values to members, leaving UNKNOWN to the caller's default"""
+    lookup = {}
+    for name, member in enum_cls.__members__.items():
+        if name != 'UNKNOWN':
+            lookup[name] = member
+            lookup[member._value_] = member
+    return lookup
+
+
+# Upper-cased LLM response strings -> enums, built once for _build_parsed_rfq
+_DIRECTION_LOOKUP: Dict[str, Direction] = {**_enum_lookup(Direction), '2WAY': Direction.TWO_WAY}
+_ASSET_CLASS_LOOKUP: Dict[str, AssetClass] = _enum_lookup(AssetClass)
+_URGENCY_LOOKUP: Dict[str, Urgency] = _enum_lookup(Urgency)
 
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
     """Contact information for RFQ sender or recipient"""
     name: Optional[str] = None
@@ -107,15 +234,23 @@ class ContactInfo:
     reuters_id: Optional[str] = None        # Reuters dealing ID
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'name': self.name,
+            'email': self.email,
+            'phone': self.phone,
+            'desk': self.desk,
+            'role': self.role,
+            'bloomberg_id': self.bloomberg_id,
+            'reuters_id': self.reuters_id,
+        }
     
     def is_empty(self) -> bool:
         """Check if contact info has any data"""
-        return not any([self.name, self.email, self.phone, self.desk, 
-                       self.role, self.bloomberg_id, self.reuters_id])
+        return not (self.name or self.email or self.phone or self.desk
+                    or self.role or self.bloomberg_id or self.reuters_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyInfo:
     """Company/counterparty information"""
     name: str = ""
@@ -132,15 +267,24 @@ class CompanyInfo:
             raise ValueError("name is required")
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'name': self.name,
+            'legal_entity': self.legal_entity,
+            'lei': self.lei,
+            'country': self.country,
+            'sector': self.sector,
+            'relationship_manager': self.relationship_manager,
+            'credit_rating': self.credit_rating,
+            'is_internal': self.is_internal,
+        }
     
     def is_empty(self) -> bool:
         """Check if company info has any data"""
-        return not any([self.name, self.legal_entity, self.lei, 
-                       self.country, self.sector])
+        return not (self.name or self.legal_entity or self.lei
+                    or self.country or self.sector)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParserConfig:
     """Configuration options for the RFQ parser"""
     # LLM settings
@@ -148,7 +292,11 @@ class ParserConfig:
     llm_model: str = "mistral-large-latest"
     llm_temperature: float = 0.1
     llm_max_tokens: int = 2000
-    llm_timeout: float = 30.0
+    llm_timeout: float = 30.0  # Seconds per Mistral request
+    llm_retries: int = 1  # Extra attempts after a timed-out request
+    coalesce_window: float = 0.02  # Seconds parse_coalesced waits to fill a batch
+    coalesce_max_batch: int = 8
+    cache_size: int = 4096  # Parsed results kept per parser (0 disables)
     
     # Parsing behavior
     extract_contacts: bool = True
@@ -171,9 +319,29 @@ class ParserConfig:
     include_parsing_notes: bool = True
     
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result['default_asset_class'] = self.default_asset_class.value
-        return result
+        return {
+            'use_llm': self.use_llm,
+            'llm_model': self.llm_model,
+            'llm_temperature': self.llm_temperature,
+            'llm_max_tokens': self.llm_max_tokens,
+            'llm_timeout': self.llm_timeout,
+            'llm_retries': self.llm_retries,
+            'coalesce_window': self.coalesce_window,
+            'coalesce_max_batch': self.coalesce_max_batch,
+            'cache_size': self.cache_size,
+            'extract_contacts': self.extract_contacts,
+            'extract_company': self.extract_company,
+            'extract_line_items': self.extract_line_items,
+            'default_currency': self.default_currency,
+            'default_asset_class': self.default_asset_class._value_,
+            'min_confidence_threshold': self.min_confidence_threshold,
+            'high_confidence_threshold': self.high_confidence_threshold,
+            'use_regex_fallback': self.use_regex_fallback,
+            'regex_only': self.regex_only,
+            'include_raw_text': self.include_raw_text,
+            'include_timestamps': self.include_timestamps,
+            'include_parsing_notes': self.include_parsing_notes,
+        }
     
     @classmethod
     def default(cls) -> 'ParserConfig':
@@ -191,7 +359,7 @@ class ParserConfig:
         return cls(use_llm=True, llm_temperature=0.05, min_confidence_threshold=0.5)
 
 
-@dataclass
+@dataclass(slots=True)
 class LineItem:
     """
     Represents a single line item in a multi-item RFQ.
@@ -217,17 +385,80 @@ class LineItem:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with enum values as strings"""
-        result = asdict(self)
-        result['direction'] = self.direction.value
-        result['asset_class'] = self.asset_class.value
-        return result
+        # _value_ skips the .value descriptor; see ParsedRFQ.to_dict
+        return {
+            'item_number': self.item_number,
+            'direction': self.direction._value_,
+            'asset_class': self.asset_class._value_,
+            'instrument': self.instrument,
+            'quantity': self.quantity,
+            'quantity_unit': self.quantity_unit,
+            'unit': self.unit,
+            'currency_pair': self.currency_pair,
+            'notional': self.notional,
+            'notional_currency': self.notional_currency,
+            'settlement_date': self.settlement_date,
+            'tenor': self.tenor,
+            'strike': self.strike,
+            'price': self.price,
+            'side': self.side,
+            'rate': self.rate,
+            'description': self.description,
+        }
 
 
-@dataclass
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+# Clock used for ParsedRFQ.timestamp; tests may swap in a constant
+_now_provider: Callable[[], str] = _now_iso
+
+# Set by freeze_time()/batch_timestamp() so every RFQ in the block shares one timestamp
+_batch_timestamp: ContextVar[Optional[str]] = ContextVar('_batch_timestamp', default=None)
+
+
+@contextmanager
+def freeze_time(timestamp: str):
+    """
+    Stamp every ParsedRFQ created inside the block with a fixed timestamp
+
+    Skips the clock entirely, so mock-driven parses are deterministic.
+    """
+    token = _batch_timestamp.set(timestamp)
+    try:
+        yield
+    finally:
+        _batch_timestamp.reset(token)
+
+
+@contextmanager
+def batch_timestamp():
+    """
+    Stamp every ParsedRFQ created inside the block with the same timestamp
+
+    Saves a clock read and isoformat() per RFQ when parsing large batches.
+    """
+    with freeze_time(_now_provider()):
+        yield
+
+
+def _finite_json_value(value: Any) -> Any:
+    """Copy of value with NaN/inf floats replaced by None, as orjson writes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_json_value(item) for item in value]
+    return value
+
+
+@dataclass(slots=True)
 class ParsedRFQ:
     """Structured representation of a parsed RFQ"""
     raw_text: str
-    rfq_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    rfq_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     direction: Direction = Direction.UNKNOWN
     asset_class: AssetClass = AssetClass.UNKNOWN
     instrument: str = ""
@@ -245,30 +476,90 @@ class ParsedRFQ:
     additional_terms: Dict[str, Any] = field(default_factory=dict)
     confidence_score: float = 0.0
     parsing_notes: List[str] = field(default_factory=list)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=lambda: _batch_timestamp.get() or _now_provider())
     line_items: List[LineItem] = field(default_factory=list)
     contact_info: Optional[ContactInfo] = None
     company_info: Optional[CompanyInfo] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with enum values as strings"""
-        result = asdict(self)
-        result['direction'] = self.direction.value
-        result['asset_class'] = self.asset_class.value
-        result['urgency'] = self.urgency.value
-        result['urgency_level'] = self.urgency_level.value
-        # Convert line items
-        result['line_items'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in self.line_items]
-        # Convert contact_info and company_info
-        if self.contact_info:
-            result['contact_info'] = self.contact_info.to_dict() if hasattr(self.contact_info, 'to_dict') else self.contact_info
-        if self.company_info:
-            result['company_info'] = self.company_info.to_dict() if hasattr(self.company_info, 'to_dict') else self.company_info
-        return result
+        # Containers are copied one level deep so callers can't mutate the RFQ
+        # through the returned dict. Enum values are read from _value_, the
+        # plain attribute behind the much slower .value descriptor.
+        return {
+            'raw_text': self.raw_text,
+            'rfq_id': self.rfq_id,
+            'direction': self.direction._value_,
+            'asset_class': self.asset_class._value_,
+            'instrument': self.instrument,
+            'quantity': self.quantity,
+            'quantity_unit': self.quantity_unit,
+            'currency_pair': self.currency_pair,
+            'notional': self.notional,
+            'notional_currency': self.notional_currency,
+            'settlement_date': self.settlement_date,
+            'tenor': self.tenor,
+            'strike': self.strike,
+            'client_name': self.client_name,
+            'urgency': self.urgency._value_,
+            'urgency_level': self.urgency_level._value_,
+            'additional_terms': dict(self.additional_terms),
+            'confidence_score': self.confidence_score,
+            'parsing_notes': list(self.parsing_notes),
+            'timestamp': self.timestamp,
+            'line_items': [item.to_dict() for item in self.line_items],
+            'contact_info': self.contact_info.to_dict() if self.contact_info else None,
+            'company_info': self.company_info.to_dict() if self.company_info else None,
+        }
+
+    def copy(self) -> 'ParsedRFQ':
+        """Copy with its own containers; line items and contact/company info are shared"""
+        # Explicit keywords skip dataclasses.replace's per-field introspection
+        # and the uuid/clock default factories
+        return ParsedRFQ(
+            raw_text=self.raw_text,
+            rfq_id=self.rfq_id,
+            direction=self.direction,
+            asset_class=self.asset_class,
+            instrument=self.instrument,
+            quantity=self.quantity,
+            quantity_unit=self.quantity_unit,
+            currency_pair=self.currency_pair,
+            notional=self.notional,
+            notional_currency=self.notional_currency,
+            settlement_date=self.settlement_date,
+            tenor=self.tenor,
+            strike=self.strike,
+            client_name=self.client_name,
+            urgency=self.urgency,
+            urgency_level=self.urgency_level,
+            additional_terms=dict(self.additional_terms),
+            confidence_score=self.confidence_score,
+            parsing_notes=list(self.parsing_notes),
+            timestamp=self.timestamp,
+            line_items=list(self.line_items),
+            contact_info=self.contact_info,
+            company_info=self.company_info,
+        )
 
     def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=indent)
+        """
+        Convert to JSON string
+
+        Non-ASCII text is written as-is and NaN/inf become null, so the
+        output is identical with or without orjson installed.
+        """
+        data = self.to_dict()
+        if orjson is not None and indent == 2:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:
+                pass  # ints beyond 64 bits or non-str keys in additional_terms; json accepts both
+        try:
+            return json.dumps(data, indent=indent, ensure_ascii=False, allow_nan=False)
+        except ValueError:
+            # Only reached for non-finite floats, so the common path skips the walk
+            return json.dumps(_finite_json_value(data), indent=indent, ensure_ascii=False)
 
     def validate_with_cpp(self) -> Optional[Any]:
         """
@@ -479,14 +770,14 @@ class ParsedRFQ:
 # MOCK MISTRAL CLIENT (for testing)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MockMessage:
     """Mock message response"""
     content: str
     role: str = "assistant"
 
 
-@dataclass  
+@dataclass(slots=True)
 class MockChoice:
     """Mock choice in response"""
     message: MockMessage
@@ -494,7 +785,7 @@ class MockChoice:
     finish_reason: str = "stop"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockResponse:
     """Mock response from Mistral API"""
     choices: List[MockChoice]
@@ -509,6 +800,50 @@ class MockResponse:
         )
 
 
+@dataclass(slots=True)
+class MockStreamChoice:
+    """Mock choice in a streamed chunk"""
+    delta: MockMessage
+    index: int = 0
+    finish_reason: Optional[str] = None
+
+
+@dataclass(slots=True)
+class MockStreamChunk:
+    """Mock streamed completion chunk"""
+    choices: List[MockStreamChoice]
+    model: str = "mock-model"
+    id: str = "mock-id"
+
+
+@dataclass(slots=True)
+class MockStreamEvent:
+    """Mock event yielded by chat.stream (mirrors mistralai's CompletionEvent)"""
+    data: MockStreamChunk
+
+    @classmethod
+    def from_delta(cls, content: str, finish_reason: Optional[str] = None) -> 'MockStreamEvent':
+        """Create a stream event carrying one content delta"""
+        return cls(data=MockStreamChunk(choices=[
+            MockStreamChoice(delta=MockMessage(content=content), finish_reason=finish_reason)
+        ]))
+
+
+# Template for MockMistralClient.default_response; copied per client, with
+# parsing_notes turned back into a list
+_DEFAULT_RFQ_RESPONSE: 'MappingProxyType[str, Any]' = MappingProxyType({
+    "direction": "BUY",
+    "asset_class": "FX_SPOT",
+    "instrument": "EURUSD",
+    "quantity": 10000000,
+    "quantity_unit": "MM",
+    "currency_pair": "EUR/USD",
+    "urgency": "NORMAL",
+    "confidence_score": 0.95,
+    "parsing_notes": ("Parsed by MockMistralClient",),
+})
+
+
 class MockMistralClient:
     """
     Mock Mistral client for testing without API calls.
@@ -529,32 +864,45 @@ class MockMistralClient:
         Args:
             default_response: Default JSON response to return for all requests
         """
-        self.default_response = default_response or self._default_rfq_response()
-        self.call_history: List[Dict[str, Any]] = []
+        self.default_response: Dict[str, Any] = default_response or dict(
+            _DEFAULT_RFQ_RESPONSE, parsing_notes=list(_DEFAULT_RFQ_RESPONSE["parsing_notes"])
+        )
         self.custom_responses: Dict[str, Dict[str, Any]] = {}
+        # Call history kept as parallel columns; see call_history
+        self._call_lock = threading.Lock()
+        self._call_models: List[str] = []
+        self._call_messages: List[List[Dict[str, str]]] = []
+        self._call_temperatures: List[float] = []
+
+    @property
+    def call_history(self) -> List[Dict[str, Any]]:
+        """Recorded calls as dicts, built on access from the column store"""
+        return [
+            {'model': model, 'messages': messages, 'temperature': temperature}
+            for model, messages, temperature in zip(
+                self._call_models, self._call_messages, self._call_temperatures
+            )
+        ]
 
     @property
     def call_count(self) -> int:  # ADD - property instead of method
-        return len(self.call_history)
+        return len(self._call_models)
+
+    def _record_call(self, model: str, messages: List[Dict[str, str]], temperature: float = 0.1) -> None:
+        """Append one call to the history columns"""
+        # Locked so concurrent parse_batch calls keep the columns aligned
+        with self._call_lock:
+            self._call_models.append(model)
+            self._call_messages.append(messages)
+            self._call_temperatures.append(temperature)
 
     def parse_rfq(self, text: str) -> Dict[str, Any]:  # ADD THIS METHOD
-        """Direct parsing method for testing"""
-        return self._get_response_for_rfq(text)
+        """Direct parsing method for testing; returns a dict the caller may mutate"""
+        response = dict(self._get_response_for_rfq(text))
+        if isinstance(response.get("parsing_notes"), list):
+            response["parsing_notes"] = list(response["parsing_notes"])
+        return response
 
-    def _default_rfq_response(self) -> Dict[str, Any]:
-        """Default RFQ parsing response"""
-        return {
-            "direction": "BUY",
-            "asset_class": "FX_SPOT",
-            "instrument": "EURUSD",
-            "quantity": 10000000,
-            "quantity_unit": "MM",
-            "currency_pair": "EUR/USD",
-            "urgency": "NORMAL",
-            "confidence_score": 0.95,
-            "parsing_notes": ["Parsed by MockMistralClient"]
-        }
-    
     def set_response(self, rfq_pattern: str, response: Dict[str, Any]) -> None:
         """
         Set a custom response for RFQs matching a pattern.
@@ -566,7 +914,13 @@ class MockMistralClient:
         self.custom_responses[rfq_pattern.lower()] = response
     
     def _get_response_for_rfq(self, rfq_text: str) -> Dict[str, Any]:
-        """Get appropriate response based on RFQ text"""
+        """
+        Get appropriate response based on RFQ text
+
+        The returned dict may be default_response itself or a custom
+        response, so callers must treat it as read-only; complete() only
+        serializes it and parse_rfq() returns a copy.
+        """
         rfq_lower = rfq_text.lower()
         
         # Check custom responses first
@@ -574,53 +928,60 @@ class MockMistralClient:
             if pattern in rfq_lower:
                 return response
         
-        # Generate smart response based on content
-        response = self.default_response.copy()
+        # Collect overrides; the defaults are only copied if something was detected
+        updates: Dict[str, Any] = {}
+        
+        # One scan collects every direction/urgency keyword and pair
+        hits = set()
+        pairs = set()
+        for match in _MOCK_KEYWORD_RE.finditer(rfq_lower):
+            if match.lastgroup == 'pair':
+                pairs.add(match.group('pair').replace('/', ''))
+            else:
+                hits.add(match.lastgroup)
         
         # Detect direction
-        if any(word in rfq_lower for word in ['sell', 'offer', 'short']):
-            response['direction'] = 'SELL'
-        elif any(word in rfq_lower for word in ['buy', 'bid', 'long']):
-            response['direction'] = 'BUY'
-        elif any(word in rfq_lower for word in ['two-way', '2-way', 'both']):
-            response['direction'] = 'TWO_WAY'
+        if 'sell' in hits:
+            updates['direction'] = 'SELL'
+        elif 'buy' in hits:
+            updates['direction'] = 'BUY'
+        elif 'two_way' in hits:
+            updates['direction'] = 'TWO_WAY'
         
         # Detect urgency
-        if any(word in rfq_lower for word in ['urgent', 'asap', 'immediately']):
-            response['urgency'] = 'IMMEDIATE'
-        elif any(word in rfq_lower for word in ['eod', 'end of day']):
-            response['urgency'] = 'END_OF_DAY'
+        if 'immediate' in hits:
+            updates['urgency'] = 'IMMEDIATE'
+        elif 'eod' in hits:
+            updates['urgency'] = 'END_OF_DAY'
         
-        # Detect currency pairs
-        pairs = ['eurusd', 'gbpusd', 'usdjpy', 'usdchf', 'audusd', 'nzdusd', 'usdcad']
-        for pair in pairs:
-            if pair in rfq_lower or f"{pair[:3]}/{pair[3:]}" in rfq_lower:
-                response['currency_pair'] = f"{pair[:3].upper()}/{pair[3:].upper()}"
-                response['instrument'] = pair.upper()
+        # Detect currency pairs, first in _MOCK_PAIRS order wins
+        for pair in _MOCK_PAIRS:
+            if pair in pairs:
+                updates['currency_pair'] = f"{pair[:3].upper()}/{pair[3:].upper()}"
+                updates['instrument'] = pair.upper()
                 break
         
         # Detect tenor (forward)
-        tenor_match = re.search(r'(\d+)\s*(m|month|y|year|w|week|d|day)', rfq_lower)
+        tenor_match = _MOCK_TENOR_RE.search(rfq_lower)
         if tenor_match:
             num, unit = tenor_match.groups()
-            unit_map = {'m': 'M', 'month': 'M', 'y': 'Y', 'year': 'Y', 
-                       'w': 'W', 'week': 'W', 'd': 'D', 'day': 'D'}
-            response['tenor'] = f"{num}{unit_map.get(unit, 'M')}"
-            response['asset_class'] = 'FX_FORWARD'
+            updates['tenor'] = f"{num}{_MOCK_TENOR_UNITS.get(unit, 'M')}"
+            updates['asset_class'] = 'FX_FORWARD'
         
         # Detect amount
-        amount_match = re.search(r'(\d+(?:\.\d+)?)\s*(mm|m|k|b|mio|bn)?', rfq_lower)
+        amount_match = _MOCK_AMOUNT_RE.search(rfq_lower)
         if amount_match:
             amount = float(amount_match.group(1))
             unit = (amount_match.group(2) or '').lower()
-            multipliers = {'k': 1e3, 'm': 1e6, 'mm': 1e6, 'mio': 1e6, 'b': 1e9, 'bn': 1e9}
-            response['quantity'] = amount * multipliers.get(unit, 1)
-            response['quantity_unit'] = unit.upper() if unit else ''
+            updates['quantity'] = amount * _MOCK_AMOUNT_MULTIPLIERS.get(unit, 1)
+            updates['quantity_unit'] = unit.upper() if unit else ''
         
-        return response
+        if not updates:
+            return self.default_response
+        return {**self.default_response, **updates}
     
     @property
-    def chat(self):
+    def chat(self) -> 'MockMistralClient':
         """Return self to mimic Mistral client structure"""
         return self
     
@@ -636,11 +997,7 @@ class MockMistralClient:
         Mock the chat completion endpoint.
         """
         # Record the call
-        self.call_history.append({
-            'model': model,
-            'messages': messages,
-            'temperature': temperature
-        })
+        self._record_call(model, messages, temperature)
         
         # Extract RFQ text from messages
         rfq_text = ""
@@ -654,23 +1011,209 @@ class MockMistralClient:
         
         return MockResponse.from_content(json.dumps(response_data))
     
+    def stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.1,
+        response_format: Optional[Dict[str, str]] = None,
+        chunk_size: int = 16,
+        **kwargs
+    ) -> Iterator[MockStreamEvent]:
+        """
+        Mock the streaming chat endpoint by splitting complete()'s content
+        into chunk_size-character deltas.
+        """
+        content = self.complete(model, messages, temperature, response_format, **kwargs).choices[0].message.content
+        for start in range(0, len(content), chunk_size):
+            yield MockStreamEvent.from_delta(content[start:start + chunk_size])
+        yield MockStreamEvent.from_delta("", finish_reason="stop")
+    
     def get_call_count(self) -> int:
         """Get number of API calls made"""
-        return len(self.call_history)
+        return len(self._call_models)
     
     def get_last_call(self) -> Optional[Dict[str, Any]]:
         """Get the last API call made"""
-        return self.call_history[-1] if self.call_history else None
+        if not self._call_models:
+            return None
+        return {
+            'model': self._call_models[-1],
+            'messages': self._call_messages[-1],
+            'temperature': self._call_temperatures[-1],
+        }
     
     def reset(self) -> None:
         """Reset call history"""
-        self.call_history = []
+        self._call_models.clear()
+        self._call_messages.clear()
+        self._call_temperatures.clear()
 
 
 # =============================================================================
 # RFQ PARSER
 # =============================================================================
 
+def _cache_key(rfq_text: str) -> str:
+    """Cache key for an RFQ; long texts are hashed to bound memory"""
+    if len(rfq_text) <= 256:
+        return rfq_text
+    return hashlib.blake2b(rfq_text.encode(), digest_size=16).hexdigest()
+
+
+def _fresh_copy(rfq: ParsedRFQ) -> ParsedRFQ:
+    """Copy a cached ParsedRFQ with its own id, timestamp and mutable containers"""
+    copy = rfq.copy()
+    copy.rfq_id = uuid.uuid4().hex
+    copy.timestamp = _batch_timestamp.get() or _now_provider()
+    return copy
+
+
+def _schema_miss(data: Any) -> bool:
+    """True when an LLM response is not an RFQ object with a direction or asset class"""
+    return not isinstance(data, dict) or ('direction' not in data and 'asset_class' not in data)
+
+
+def _is_timeout(error: Exception) -> bool:
+    """True for TimeoutError and the SDK's httpx timeouts (ReadTimeout, ConnectTimeout, ...)"""
+    if isinstance(error, TimeoutError):
+        return True
+    try:
+        import httpx  # Installed with mistralai; only consulted once a call has failed
+    except ImportError:
+        return False
+    return isinstance(error, httpx.TimeoutException)
+
+
+class _DeltaSink:
+    """
+    parse_stream's callbacks, fed one LLM attempt at a time
+
+    A retried attempt (timeout or schema miss) streams a fresh response,
+    so on_reset is called first to let the consumer drop the deltas of
+    the abandoned one.
+    """
+
+    __slots__ = ("on_token", "on_reset", "dirty")
+
+    def __init__(self, on_token: Callable[[str], None], on_reset: Optional[Callable[[], None]]):
+        self.on_token = on_token
+        self.on_reset = on_reset
+        self.dirty = False
+
+    def begin_attempt(self) -> None:
+        if self.dirty and self.on_reset is not None:
+            self.on_reset()
+        self.dirty = False
+
+    def __call__(self, delta: str) -> None:
+        self.dirty = True
+        self.on_token(delta)
+
+
+class _RequestCoalescer:
+    """
+    Fuse parse requests that arrive within a short window into one LLM call
+
+    A daemon worker takes the first pending request, waits up to `window`
+    seconds for more (at most `max_batch_size`), sends them through
+    RFQParser.parse_marshaled and resolves each caller's future. The parser
+    is held weakly so an abandoned parser can still be collected; close()
+    (called by RFQParser.close or when the parser is collected) stops the
+    worker after the requests already queued.
+    """
+
+    def __init__(self, parser: 'RFQParser', window: float, max_batch_size: int):
+        self._parser_ref = weakref.ref(parser)
+        self._window = window
+        self._max_batch_size = max(1, max_batch_size)
+        # None is the shutdown sentinel
+        self._pending: 'queue.Queue[Optional[Tuple[str, Future]]]' = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="rfq-coalescer", daemon=True)
+        self._worker.start()
+
+    def submit(self, rfq_text: str) -> Future:
+        future: Future = Future()
+        self._pending.put((rfq_text, future))
+        return future
+
+    def close(self) -> None:
+        self._pending.put(None)
+
+    def _collect(self) -> Tuple[List[Tuple[str, Future]], bool]:
+        """Return the next batch and whether the shutdown sentinel was reached"""
+        item = self._pending.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self._window
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[str, Future]]) -> None:
+        # The strong reference lives only for this batch, not while idle
+        parser = self._parser_ref()
+        texts = [text for text, _ in batch]
+        try:
+            if parser is None:
+                raise RuntimeError("RFQParser was garbage-collected")
+            if len(texts) == 1:
+                results = [parser.parse(texts[0])]
+            else:
+                results = parser.parse_marshaled(texts, group_size=len(texts))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+@lru_cache(maxsize=4)
+def _get_mistral_client(api_key: str) -> Any:
+    """
+    Return the process-wide Mistral client for an API key
+
+    Parsers built with the same key share one client, and with it the
+    underlying HTTP connection pool, so TLS handshakes are paid once.
+    The pool keeps enough idle connections for concurrent parse_batch
+    workers and speaks HTTP/2 when the optional h2 package is installed.
+    Like _shared_parser, at most four keys are cached, so rotating keys
+    cannot grow the cache without bound.
+    """
+    global Mistral
+    if Mistral is None:
+        from mistralai import Mistral
+    try:
+        import httpx  # Installed with mistralai
+    except ImportError:
+        return Mistral(api_key=api_key)
+    transport = httpx.HTTPTransport(
+        http2=importlib.util.find_spec("h2") is not None,
+        retries=1,  # Connection-level retries only; requests are retried in _parse_with_llm
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+    return Mistral(api_key=api_key, client=httpx.Client(transport=transport))
+
+
 class RFQParser:
     """
     RFQ Parser with Mistral LLM backend
@@ -683,8 +1226,17 @@ class RFQParser:
     - Falls back to regex patterns when LLM unavailable
     """
     
+    # No per-instance __dict__; subclasses that add attributes get one back
+    __slots__ = (
+        "config", "model", "use_llm", "client",
+        "_coalescer", "_coalescer_lock", "_cache", "_cache_lock", "__weakref__",
+    )
+
     # Default Mistral model - can be overridden
     DEFAULT_MODEL = "mistral-large-latest"
+
+    # Terminal states reported by the Mistral batch jobs endpoint
+    BATCH_JOB_DONE_STATUSES = frozenset({"SUCCESS", "FAILED", "TIMEOUT_EXCEEDED", "CANCELLED"})
     
     # System prompt for Mistral
     SYSTEM_PROMPT = """You are an expert financial RFQ (Request for Quote) parser.
@@ -716,10 +1268,19 @@ Respond ONLY with a valid JSON object containing the extracted fields.
 If a field is not present or unclear, omit it or set to null.
 Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarifications."""
 
+    # Schema-only prompt sent by default (about a quarter of SYSTEM_PROMPT's
+    # tokens). SYSTEM_PROMPT is used to retry responses that miss the schema.
+    SYSTEM_PROMPT_COMPACT = """Extract the trading RFQ as one JSON object; omit absent fields.
+direction: BUY|SELL|TWO_WAY
+asset_class: FX_SPOT|FX_FORWARD|FX_SWAP|FX_OPTION|BOND|INTEREST_RATE_SWAP|SWAPTION|CREDIT_DEFAULT_SWAP|EQUITY|COMMODITY|UNKNOWN
+instrument, quantity (number), quantity_unit (MM=1e6, K, B), currency_pair (EUR/USD), notional, notional_currency, settlement_date, tenor (1M, 3M, 1Y), strike, client_name
+urgency: IMMEDIATE|NORMAL|END_OF_DAY
+additional_terms (object), confidence_score (0.0-1.0), parsing_notes (array)"""
+
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = DEFAULT_MODEL,
+        model: str = "mistral-large-latest",
         use_llm: bool = True,
         config: Optional[ParserConfig] = None,
         client: Optional[Any] = None  # Allow injecting mock client
@@ -737,13 +1298,22 @@ Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarif
         self.config = config or ParserConfig()
         self.model = model or self.config.llm_model
         self.use_llm = use_llm and not self.config.regex_only
-        self.client = client  # Use injected client if provided
+        self.client: Any = client  # Use injected client if provided
+        self._coalescer: Optional[_RequestCoalescer] = None
+        self._coalescer_lock = threading.Lock()
+        # LRU of parsed results keyed by _cache_key(); see parse()
+        self._cache: 'OrderedDict[str, ParsedRFQ]' = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Initialize Mistral client if not injected
         if self.client is None and self.use_llm and MISTRAL_AVAILABLE:
             api_key = api_key or os.getenv("MISTRAL_API_KEY")
             if api_key:
-                self.client = Mistral(api_key=api_key)
+                try:
+                    self.client = _get_mistral_client(api_key)
+                except ImportError as e:
+                    self.use_llm = False
+                    print(f"Warning: Could not import mistralai ({e}). Using regex fallback.")
             else:
                 self.use_llm = False
                 print("Warning: No Mistral API key found. Using regex fallback.")
@@ -758,41 +1328,231 @@ Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarif
         Returns:
             ParsedRFQ object with extracted fields
         """
+        return self._parse_with(rfq_text, self._parse_uncached)
+
+    def _parse_with(self, rfq_text: str, parse_uncached: Callable[[str], ParsedRFQ]) -> ParsedRFQ:
+        """Strip, short-circuit empty input and serve/fill the LRU around parse_uncached"""
         rfq_text = rfq_text.strip()
-        
+        if not rfq_text:
+            # Nothing to extract; skip the LLM round trip and the cache
+            return ParsedRFQ(raw_text=rfq_text, parsing_notes=["Empty RFQ text"])
+
+        cached = self._cache_lookup(rfq_text)
+        if cached is not None:
+            return cached
+        result = parse_uncached(rfq_text)
+        self._cache_store(rfq_text, result)
+        return result
+
+    def _cache_lookup(self, rfq_text: str) -> Optional[ParsedRFQ]:
+        """Fresh copy of the cached result for stripped rfq_text, or None"""
+        if self.config.cache_size <= 0:
+            return None
+        key = _cache_key(rfq_text)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        return _fresh_copy(cached) if cached is not None else None
+
+    def _cache_store(self, rfq_text: str, result: ParsedRFQ) -> None:
+        """Remember a copy of result for stripped rfq_text, evicting the oldest entry"""
+        if self.config.cache_size <= 0:
+            return
+        # Don't pin a transient LLM failure: the next parse should try the LLM again
+        if result.parsing_notes and result.parsing_notes[-1].startswith("LLM parsing failed"):
+            return
+        key = _cache_key(rfq_text)
+        with self._cache_lock:
+            self._cache[key] = _fresh_copy(result)
+            if len(self._cache) > self.config.cache_size:
+                self._cache.popitem(last=False)
+
+    def _parse_uncached(self, rfq_text: str) -> ParsedRFQ:
         if self.use_llm and self.client:
             return self._parse_with_llm(rfq_text)
         else:
             return self._parse_with_regex(rfq_text)
 
-    def _parse_with_llm(self, rfq_text: str) -> ParsedRFQ:
-        """Parse RFQ using Mistral LLM"""
-        try:
-            # Handle both real Mistral client and MockMistralClient
-            if hasattr(self.client, 'chat') and hasattr(self.client.chat, 'complete'):
-                response = self.client.chat.complete(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": f"Parse this RFQ:\n\n{rfq_text}"}
-                    ],
-                    temperature=self.config.llm_temperature,
-                    response_format={"type": "json_object"}
-                )
-            else:
-                # MockMistralClient has complete directly
-                response = self.client.complete(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": f"Parse this RFQ:\n\n{rfq_text}"}
-                    ],
-                    temperature=self.config.llm_temperature,
-                    response_format={"type": "json_object"}
+    def clear_cache(self) -> None:
+        """Drop all cached parse results"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def parse_coalesced(self, rfq_text: str) -> ParsedRFQ:
+        """
+        Parse an RFQ, sharing an LLM call with other concurrent callers
+
+        Thread-safe. Requests arriving within config.coalesce_window seconds
+        of each other are sent as one numbered prompt (see parse_marshaled),
+        so K concurrent callers pay one system prompt and one round trip.
+        Without an LLM this is just parse().
+        """
+        rfq_text = rfq_text.strip()
+        if not (self.use_llm and self.client) or not rfq_text:
+            return self.parse(rfq_text)
+        with self._coalescer_lock:
+            if self._coalescer is None:
+                self._coalescer = _RequestCoalescer(
+                    self, self.config.coalesce_window, self.config.coalesce_max_batch
                 )
-            
-            result_text = response.choices[0].message.content
-            parsed_data = json.loads(result_text)
+                # Stop the worker if the parser is dropped without close()
+                weakref.finalize(self, self._coalescer.close)
+            # Submitting under the lock keeps requests from landing behind close()'s sentinel
+            future = self._coalescer.submit(rfq_text)
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the parse_coalesced worker thread, if one was started"""
+        with self._coalescer_lock:
+            coalescer, self._coalescer = self._coalescer, None
+        if coalescer is not None:
+            coalescer.close()
+
+    def _build_messages(self, rfq_text: str, verbose: bool = False) -> List[Dict[str, str]]:
+        """Build the chat messages sent to Mistral for a single RFQ"""
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT if verbose else self.SYSTEM_PROMPT_COMPACT},
+            {"role": "user", "content": f"Parse this RFQ:\n\n{rfq_text}"}
+        ]
+
+    def _chat_complete(self, messages: List[Dict[str, str]]) -> str:
+        """Send a JSON-mode chat completion and return the response content"""
+        # Handle both real Mistral client and MockMistralClient
+        if hasattr(self.client, 'chat') and hasattr(self.client.chat, 'complete'):
+            complete = self.client.chat.complete
+        else:
+            # MockMistralClient has complete directly
+            complete = self.client.complete
+        response = complete(
+            model=self.model,
+            messages=messages,
+            temperature=self.config.llm_temperature,
+            response_format={"type": "json_object"},
+            timeout_ms=int(self.config.llm_timeout * 1000)
+        )
+        return response.choices[0].message.content
+
+    def _chat_stream(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Send a streaming JSON-mode chat completion and yield content deltas"""
+        if hasattr(self.client, 'chat') and hasattr(self.client.chat, 'stream'):
+            stream = self.client.chat.stream
+        else:
+            stream = self.client.stream
+        events = stream(
+            model=self.model,
+            messages=messages,
+            temperature=self.config.llm_temperature,
+            response_format={"type": "json_object"},
+            timeout_ms=int(self.config.llm_timeout * 1000)
+        )
+        try:
+            for event in events:
+                content = event.data.choices[0].delta.content
+                if content:
+                    yield content
+        finally:
+            # Release the HTTP connection when the caller stops early
+            close = getattr(events, 'close', None)
+            if close is not None:
+                close()
+
+    def parse_stream(
+        self,
+        rfq_text: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None
+    ) -> ParsedRFQ:
+        """
+        Parse an RFQ from a streamed LLM response
+
+        Content deltas are passed to on_token as they arrive (e.g. to show
+        the JSON filling in), and the stream is abandoned as soon as the
+        top-level JSON object closes instead of waiting for the end of the
+        completion. Otherwise behaves exactly like parse(): empty input,
+        cache hits (on_token is not called) and the schema-miss, timeout
+        and regex fallbacks are shared.
+
+        Args:
+            rfq_text: Free-form RFQ text
+            on_token: Optional callback receiving each content delta
+            on_reset: Optional callback invoked before a retried request
+                streams, meaning the deltas received so far were discarded
+
+        Returns:
+            ParsedRFQ object with extracted fields
+        """
+        if not (self.use_llm and self.client):
+            return self.parse(rfq_text)
+        sink = _DeltaSink(on_token or (lambda delta: None), on_reset)
+        return self._parse_with(rfq_text, lambda text: self._parse_with_llm(text, sink))
+
+    def _stream_json_object(self, messages: List[Dict[str, str]], sink: _DeltaSink) -> str:
+        """Stream a completion to sink and return it once the top-level JSON object closes"""
+        sink.begin_attempt()
+        buffer: List[str] = []
+        depth = 0
+        in_string = escaped = done = False
+        for delta in self._chat_stream(messages):
+            for end, char in enumerate(delta, 1):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == '\\':
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                    if depth == 0:
+                        delta = delta[:end]
+                        done = True
+                        break
+            buffer.append(delta)
+            sink(delta)
+            if done:
+                break
+        return "".join(buffer)
+
+    def _complete_json(
+        self,
+        messages: List[Dict[str, str]],
+        sink: Optional[_DeltaSink] = None
+    ) -> Any:
+        """Chat completion decoded as JSON, retrying timed-out requests
+
+        With a sink the completion is streamed through _stream_json_object.
+        """
+        attempt = 0
+        while True:
+            try:
+                if sink is None:
+                    return _json_loads(self._chat_complete(messages))
+                return _json_loads(self._stream_json_object(messages, sink))
+            except Exception as e:
+                # Only a slow tail is worth another attempt; other errors fall back now
+                if attempt >= self.config.llm_retries or not _is_timeout(e):
+                    raise
+                attempt += 1
+
+    def _parse_with_llm(
+        self,
+        rfq_text: str,
+        sink: Optional[_DeltaSink] = None
+    ) -> ParsedRFQ:
+        """Parse RFQ using Mistral LLM, streaming deltas to sink if given"""
+        try:
+            try:
+                parsed_data = self._complete_json(self._build_messages(rfq_text), sink)
+            except ValueError:
+                parsed_data = None  # Invalid JSON counts as a schema miss
+            if _schema_miss(parsed_data):
+                # The compact prompt wasn't enough; retry once with the full instructions
+                parsed_data = self._complete_json(self._build_messages(rfq_text, verbose=True), sink)
             
             return self._build_parsed_rfq(rfq_text, parsed_data)
             
@@ -807,112 +1567,79 @@ Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarif
         parsed = ParsedRFQ(raw_text=rfq_text)
         parsed.parsing_notes.append("Parsed using regex fallback (no LLM)")
         
+        # One upper-cased copy, shared by every pattern below, is cheaper than
+        # re.IGNORECASE matching
         text_upper = rfq_text.upper()
+        tokens = frozenset(_TOKEN_RE.findall(text_upper))
         
         # Direction detection
-        if any(word in text_upper for word in ['BUY', 'BID', 'LONG', 'MINE']):
+        if tokens & _BUY_WORDS:
             parsed.direction = Direction.BUY
-        elif any(word in text_upper for word in ['SELL', 'OFFER', 'SHORT', 'YOURS']):
+        elif tokens & _SELL_WORDS:
             parsed.direction = Direction.SELL
-        elif any(word in text_upper for word in ['TWO-WAY', '2-WAY', 'BOTH SIDES']):
+        elif any(phrase in text_upper for phrase in _TWO_WAY_PHRASES):
             parsed.direction = Direction.TWO_WAY
         
         # Currency pair detection (FX)
-        valid_ccys = ['EUR', 'USD', 'GBP', 'JPY', 'CHF', 'AUD', 'NZD', 'CAD', 'CNY', 'HKD', 'SGD', 'NOK', 'SEK', 'DKK', 'MXN', 'ZAR']
-        
-        for ccy1 in valid_ccys:
-            for ccy2 in valid_ccys:
-                if ccy1 != ccy2:
-                    patterns = [
-                        rf'\b{ccy1}/{ccy2}\b',
-                        rf'\b{ccy1}{ccy2}\b',
-                        rf'\b{ccy1}\s+{ccy2}\b',
-                    ]
-                    for pattern in patterns:
-                        if re.search(pattern, text_upper):
-                            parsed.currency_pair = f"{ccy1}/{ccy2}"
-                            parsed.instrument = f"{ccy1}{ccy2}"
-                            parsed.asset_class = AssetClass.FX_SPOT
-                            break
-                    if parsed.currency_pair:
-                        break
-            if parsed.currency_pair:
-                break
+        pair_match = _CCY_PAIR_RE.search(text_upper)
+        if pair_match:
+            parsed.currency_pair, parsed.instrument = _CCY_PAIR_STRINGS[pair_match.groups()]
+            parsed.asset_class = AssetClass.FX_SPOT
         
         # Amount detection
-        amount_pattern = r'(\d+(?:\.\d+)?)\s*(MM|M|K|B|MIO|MLN|BN)?\b'
-        amount_match = re.search(amount_pattern, rfq_text, re.IGNORECASE)
-        if amount_match:
-            amount = float(amount_match.group(1))
-            unit = (amount_match.group(2) or '').upper()
-            
-            multipliers = {'K': 1e3, 'M': 1e6, 'MM': 1e6, 'MIO': 1e6, 'MLN': 1e6, 'B': 1e9, 'BN': 1e9}
-            if unit in multipliers:
-                parsed.quantity = amount * multipliers[unit]
-                parsed.quantity_unit = unit
-            else:
-                parsed.quantity = amount
+        quantity = _parse_quantity(text_upper)
+        if quantity:
+            parsed.quantity, parsed.quantity_unit = quantity
         
         # Tenor detection
-        tenor_pattern = r'\b(\d+)\s*(D|W|M|Y|DAY|WEEK|MONTH|YEAR)S?\b'
-        tenor_match = re.search(tenor_pattern, rfq_text, re.IGNORECASE)
+        tenor_match = _TENOR_RE.search(text_upper)
         if tenor_match:
             num, unit = tenor_match.groups()
-            unit_map = {'D': 'D', 'DAY': 'D', 'W': 'W', 'WEEK': 'W', 
-                       'M': 'M', 'MONTH': 'M', 'Y': 'Y', 'YEAR': 'Y'}
-            parsed.tenor = f"{num}{unit_map.get(unit.upper(), unit.upper())}"
+            parsed.tenor = f"{num}{_TENOR_UNITS.get(unit, unit)}"
             if parsed.asset_class == AssetClass.FX_SPOT:
                 parsed.asset_class = AssetClass.FX_FORWARD
         
         # Asset class detection for IRS and Swaptions
-        if any(word in text_upper for word in ['SWAPTION', 'SWAP OPTION']):
+        if tokens & _SWAPTION_WORDS or 'SWAP OPTION' in text_upper:
             parsed.asset_class = AssetClass.SWAPTION
             # Extract strike if present
-            strike_pattern = r'\bSTRIKE\s+(\d+(?:\.\d+)?)\s*%?'
-            strike_match = re.search(strike_pattern, text_upper)
+            strike_match = _STRIKE_RE.search(text_upper)
             if strike_match:
                 parsed.strike = float(strike_match.group(1))
             # Extract currency for IRS/Swaption
-            for ccy in valid_ccys:
-                if f' {ccy} ' in f' {text_upper} ' or text_upper.startswith(ccy) or text_upper.endswith(ccy):
-                    parsed.notional_currency = ccy
-                    break
+            parsed.notional_currency = _notional_currency(text_upper)
             # Set notional from quantity
             if parsed.quantity:
                 parsed.notional = parsed.quantity
-        elif any(word in text_upper for word in ['IRS', 'INTEREST RATE SWAP', 'SWAP']):
+        elif tokens & _IRS_WORDS:
             parsed.asset_class = AssetClass.IRS
             # Extract fixed rate if present
-            rate_pattern = r'(?:FIXED|PAYING|AT)\s+(\d+(?:\.\d+)?)\s*%'
-            rate_match = re.search(rate_pattern, text_upper)
+            rate_match = _FIXED_RATE_RE.search(text_upper)
             if rate_match:
                 parsed.strike = float(rate_match.group(1))
             # Extract currency for IRS
-            for ccy in valid_ccys:
-                if f' {ccy} ' in f' {text_upper} ' or text_upper.startswith(ccy) or text_upper.endswith(ccy):
-                    parsed.notional_currency = ccy
-                    break
+            parsed.notional_currency = _notional_currency(text_upper)
             # Set notional from quantity
             if parsed.quantity:
                 parsed.notional = parsed.quantity
 
         # Urgency detection
-        if any(word in text_upper for word in ['URGENT', 'ASAP', 'NOW', 'IMMEDIATELY']):
+        if tokens & _URGENT_WORDS:
             parsed.urgency = Urgency.IMMEDIATE
             parsed.urgency_level = UrgencyLevel.URGENT
-        elif any(word in text_upper for word in ['EOD', 'END OF DAY', 'CLOSE']):
+        elif tokens & _EOD_WORDS or 'END OF DAY' in text_upper:
             parsed.urgency = Urgency.EOD
             parsed.urgency_level = UrgencyLevel.LOW
         
         # Confidence based on fields extracted
-        fields_found = sum([
-            parsed.direction != Direction.UNKNOWN,
-            parsed.asset_class != AssetClass.UNKNOWN,
-            bool(parsed.instrument),
-            parsed.quantity is not None,
-            bool(parsed.currency_pair)
-        ])
-        parsed.confidence_score = min(fields_found / 5, 1.0)
+        fields_found = (
+            (parsed.direction is not Direction.UNKNOWN)
+            | (parsed.asset_class is not AssetClass.UNKNOWN) << 1
+            | bool(parsed.instrument) << 2
+            | (parsed.quantity is not None) << 3
+            | bool(parsed.currency_pair) << 4
+        )
+        parsed.confidence_score = _CONFIDENCE_BY_FIELDS[fields_found]
         
         return parsed
 
@@ -921,41 +1648,15 @@ Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarif
 
         # Map direction
         direction_str = data.get('direction', '').upper()
-        direction_map = {
-            'BUY': Direction.BUY,
-            'SELL': Direction.SELL,
-            'TWO_WAY': Direction.TWO_WAY,
-            '2WAY': Direction.TWO_WAY
-        }
-        direction = direction_map.get(direction_str, Direction.UNKNOWN)
+        direction = _DIRECTION_LOOKUP.get(direction_str, Direction.UNKNOWN)
 
         # Map asset class
         asset_str = data.get('asset_class', '').upper().replace(' ', '_')
-        asset_map = {
-            'FX_SPOT': AssetClass.FX_SPOT,
-            'FX_FORWARD': AssetClass.FX_FORWARD,
-            'FX_SWAP': AssetClass.FX_SWAP,
-            'FX_OPTION': AssetClass.FX_OPTION,
-            'BOND': AssetClass.BOND,
-            'INTEREST_RATE_SWAP': AssetClass.IRS,
-            'IRS': AssetClass.IRS,
-            'SWAPTION': AssetClass.SWAPTION,
-            'CREDIT_DEFAULT_SWAP': AssetClass.CDS,
-            'CDS': AssetClass.CDS,
-            'EQUITY': AssetClass.EQUITY,
-            'COMMODITY': AssetClass.COMMODITY
-        }
-        asset_class = asset_map.get(asset_str, AssetClass.UNKNOWN)
+        asset_class = _ASSET_CLASS_LOOKUP.get(asset_str, AssetClass.UNKNOWN)
 
         # Map urgency
         urgency_str = data.get('urgency', '').upper()
-        urgency_map = {
-            'IMMEDIATE': Urgency.IMMEDIATE,
-            'NORMAL': Urgency.NORMAL,
-            'END_OF_DAY': Urgency.EOD,
-            'EOD': Urgency.EOD
-        }
-        urgency = urgency_map.get(urgency_str, Urgency.NORMAL)
+        urgency = _URGENCY_LOOKUP.get(urgency_str, Urgency.NORMAL)
 
         # Map urgency level
         urgency_level = UrgencyLevel.from_string(urgency_str) if urgency_str else UrgencyLevel.NORMAL
@@ -987,19 +1688,209 @@ Include a "confidence_score" (0.0-1.0) and "parsing_notes" array with any clarif
 
         return parsed
 
-    def parse_batch(self, rfq_texts: List[str]) -> List[ParsedRFQ]:
-        """Parse multiple RFQ messages"""
-        return [self.parse(text) for text in rfq_texts]
+    def parse_batch(self, rfq_texts: List[str], max_workers: int = 8) -> List[ParsedRFQ]:
+        """Parse multiple RFQ messages (LLM calls run concurrently)"""
+        return list(self.iter_parse_batch(rfq_texts, max_workers))
+
+    def iter_parse_batch(self, rfq_texts: List[str], max_workers: int = 8) -> Iterator[ParsedRFQ]:
+        """
+        Yield parsed RFQs in input order as they complete
+
+        In LLM mode the calls are network-bound, so up to max_workers of them
+        run in a thread pool and the batch costs roughly one round trip per
+        max_workers RFQs. Regex parsing is CPU-bound and stays serial.
+        Every RFQ in the batch shares one timestamp.
+        """
+        timestamp = _batch_timestamp.get() or _now_provider()
+
+        def parse_at(text: str) -> ParsedRFQ:
+            # Worker threads don't inherit the caller's context, so pin it per call
+            with freeze_time(timestamp):
+                return self.parse(text)
+
+        if not (self.use_llm and self.client) or len(rfq_texts) < 2 or max_workers < 2:
+            for text in rfq_texts:
+                yield parse_at(text)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(rfq_texts))) as executor:
+            yield from executor.map(parse_at, rfq_texts)
+
+    def parse_marshaled(self, rfq_texts: List[str], group_size: int = 8) -> List[ParsedRFQ]:
+        """
+        Parse several RFQs per LLM call by numbering them in a single prompt
+
+        Amortizes the system prompt and network round trip across each group
+        of group_size RFQs. RFQs missing from a group's response (or whole
+        groups whose call fails) are re-parsed individually with parse().
+        Shares parse()'s result cache: cached texts are not sent to the LLM.
+
+        Args:
+            rfq_texts: Free-form RFQ texts
+            group_size: Maximum number of RFQs per LLM call
+
+        Returns:
+            ParsedRFQ objects in the same order as rfq_texts
+        """
+        rfq_texts = [text.strip() for text in rfq_texts]
+        if not (self.use_llm and self.client):
+            return self.parse_batch(rfq_texts)
+
+        # Cached and empty texts never reach the LLM; see parse()
+        results: List[Optional[ParsedRFQ]] = [
+            self._cache_lookup(text) if text else None for text in rfq_texts
+        ]
+        pending = [index for index, text in enumerate(rfq_texts) if text and results[index] is None]
+        for start in range(0, len(pending), group_size):
+            indices = pending[start:start + group_size]
+            group = [rfq_texts[index] for index in indices]
+            numbered = "\n".join(f"{number}) {text}" for number, text in enumerate(group, 1))
+            messages = [
+                {"role": "system", "content": self.SYSTEM_PROMPT_COMPACT},
+                {"role": "user", "content": (
+                    f"Parse each of these {len(group)} RFQs. Respond with a JSON object "
+                    '{"rfqs": [...]} holding one object per RFQ, each with an "index" '
+                    f"field set to the RFQ number:\n\n{numbered}"
+                )}
+            ]
+            try:
+                data = _json_loads(self._chat_complete(messages))
+                items = data.get("rfqs", []) if isinstance(data, dict) else data
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    number = item.get("index")
+                    if isinstance(number, int) and 1 <= number <= len(group):
+                        parsed = self._build_parsed_rfq(group[number - 1], item)
+                        self._cache_store(group[number - 1], parsed)
+                        results[indices[number - 1]] = parsed
+            except Exception:
+                pass  # Unparsed rows are retried individually below
+
+        return [
+            parsed if parsed is not None else self.parse(text)
+            for parsed, text in zip(results, rfq_texts)
+        ]
+
+    def parse_batch_via_mistral_api(
+        self,
+        rfq_texts: List[str],
+        poll_interval: float = 2.0,
+        timeout: float = 600.0,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[ParsedRFQ]:
+        """
+        Parse many RFQs through Mistral's Batch API (one job instead of N calls)
+
+        Each RFQ is written as one JSONL request keyed by its index, uploaded
+        with purpose="batch", and processed as a single batch job. RFQs the
+        job returns no usable result for fall back to regex parsing.
+
+        Args:
+            rfq_texts: Free-form RFQ texts
+            poll_interval: Seconds between job status polls
+            timeout: Seconds to wait for the job before cancelling it
+            progress_callback: Called as progress_callback(completed, total) on each poll
+
+        Returns:
+            ParsedRFQ objects in the same order as rfq_texts
+        """
+        rfq_texts = [text.strip() for text in rfq_texts]
+        if not rfq_texts:
+            return []
+
+        # Injected clients without the files/batch APIs (e.g. MockMistralClient)
+        if not (self.use_llm and hasattr(self.client, 'files') and hasattr(self.client, 'batch')):
+            return self.parse_batch(rfq_texts)
+
+        total = len(rfq_texts)
+        results: List[Optional[ParsedRFQ]] = [None] * total
+        failure_note = "Batch API returned no result for this RFQ. Used regex fallback."
+
+        try:
+            batch_input = "\n".join(
+                json.dumps({
+                    "custom_id": str(index),
+                    "body": {
+                        "messages": self._build_messages(text),
+                        "temperature": self.config.llm_temperature,
+                        "max_tokens": self.config.llm_max_tokens,
+                        "response_format": {"type": "json_object"}
+                    }
+                })
+                for index, text in enumerate(rfq_texts)
+            )
+            input_file = self.client.files.upload(
+                file={"file_name": "rfq_batch.jsonl", "content": batch_input.encode("utf-8")},
+                purpose="batch"
+            )
+            job = self.client.batch.jobs.create(
+                input_files=[input_file.id],
+                model=self.model,
+                endpoint="/v1/chat/completions",
+                metadata={"job_type": "rfq_parsing"}
+            )
+
+            deadline = time.monotonic() + timeout
+            while job.status not in self.BATCH_JOB_DONE_STATUSES:
+                if time.monotonic() > deadline:
+                    self.client.batch.jobs.cancel(job_id=job.id)
+                    failure_note = f"Batch API job timed out after {timeout:.0f}s. Used regex fallback."
+                    break
+                time.sleep(poll_interval)
+                job = self.client.batch.jobs.get(job_id=job.id)
+                if progress_callback:
+                    progress_callback(job.completed_requests or 0, total)
+
+            if job.status == "SUCCESS" and job.output_file:
+                output = self.client.files.download(file_id=job.output_file).read()
+                for line in output.decode("utf-8").splitlines():
+                    if not line.strip():
+                        continue
+                    # A malformed record only costs its own RFQ, which falls
+                    # back to regex below; the rest of the output is kept
+                    try:
+                        record = _json_loads(line)
+                        response = record.get("response") or {}
+                        if response.get("status_code") != 200:
+                            continue
+                        index = int(record["custom_id"])
+                        content = response["body"]["choices"][0]["message"]["content"]
+                        results[index] = self._build_parsed_rfq(rfq_texts[index], _json_loads(content))
+                    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                        continue
+            elif job.status in self.BATCH_JOB_DONE_STATUSES:
+                failure_note = f"Batch API job ended with status {job.status}. Used regex fallback."
+
+        except Exception as e:
+            failure_note = f"Batch API failed: {str(e)}. Used regex fallback."
+
+        parsed_rfqs: List[ParsedRFQ] = []
+        for parsed, text in zip(results, rfq_texts):
+            if parsed is None:
+                parsed = self._parse_with_regex(text)
+                parsed.parsing_notes.append(failure_note)
+            parsed_rfqs.append(parsed)
+
+        if progress_callback:
+            progress_callback(total, total)
+        return parsed_rfqs
 
 
 # =============================================================================
 # CONVENIENCE FUNCTION
 # =============================================================================
 
+@lru_cache(maxsize=4)
+def _shared_parser(api_key: Optional[str]) -> RFQParser:
+    """Parser reused by parse_rfq, one per resolved API key"""
+    return RFQParser(api_key=api_key)
+
+
 def parse_rfq(text: str, api_key: Optional[str] = None) -> ParsedRFQ:
     """Quick function to parse a single RFQ"""
-    parser = RFQParser(api_key=api_key)
-    return parser.parse(text)
+    # Resolve the env key first so a changed MISTRAL_API_KEY gets its own parser
+    return _shared_parser(api_key or os.getenv("MISTRAL_API_KEY")).parse(text)
 
 
 # =============================================================================
@@ -1012,6 +1903,8 @@ __all__ = [
     "RFQParser",
     "ParsedRFQ",
     "parse_rfq",
+    "batch_timestamp",
+    "freeze_time",
     # Data classes
     "LineItem",
     "ContactInfo",
@@ -1027,6 +1920,7 @@ __all__ = [
     "MockResponse",
     "MockChoice",
     "MockMessage",
+    "MockStreamEvent",
     # Availability flags
     "MISTRAL_AVAILABLE",
     "CPP_AVAILABLE",
@@ -6,13 +6,16 @@ Run: pytest rfq_parser_tests.py -v
 
 import pytest
 import json
+from dataclasses import fields
+from types import SimpleNamespace
 
 from rfq_parser import (
     RFQParser, parse_rfq, ParsedRFQ, LineItem,
     ContactInfo, CompanyInfo, ParserConfig, UrgencyLevel,
     MockMistralClient, Direction, AssetClass, Urgency,
-    MockMessage, MockChoice, MockResponse
+    MockMessage, MockChoice, MockResponse, MockStreamEvent, batch_timestamp, freeze_time
 )
+from rfq_parser import _parse_quantity, _batch_timestamp, _DEFAULT_RFQ_RESPONSE, _get_mistral_client
 
 
 # =============================================================================
@@ -85,6 +88,12 @@ class TestEnums:
         assert UrgencyLevel.from_string("end of day") == UrgencyLevel.LOW
         assert UrgencyLevel.from_string("normal") == UrgencyLevel.NORMAL
         assert UrgencyLevel.from_string("unknown_value") == UrgencyLevel.UNKNOWN
+    
+    def test_enums_are_str_keys(self):
+        assert isinstance(Direction.BUY, str)
+        assert Direction.BUY == "BUY"
+        assert hash(AssetClass.IRS) == hash("INTEREST_RATE_SWAP")
+        assert {Direction.SELL: 1}["SELL"] == 1
 
 
 # =============================================================================
@@ -203,6 +212,11 @@ class TestParserConfig:
         assert 'use_llm' in d
         assert 'llm_model' in d
         assert d['default_asset_class'] == "UNKNOWN"
+    
+    def test_to_dict_covers_all_fields(self):
+        d = ParserConfig.fast().to_dict()
+        assert set(d) == {f.name for f in fields(ParserConfig)}
+        assert d['regex_only'] is True
 
 
 class TestLineItem:
@@ -284,6 +298,47 @@ class TestParsedRFQ:
         assert d['asset_class'] == "FX_SPOT"
         assert 'rfq_id' in d
     
+    def test_to_dict_covers_every_field(self):
+        rfq = ParsedRFQ(
+            raw_text="Test",
+            line_items=[LineItem(instrument="EURUSD")],
+            contact_info=ContactInfo(name="John"),
+            company_info=CompanyInfo(name="Acme"),
+        )
+        d = rfq.to_dict()
+        assert set(d) == {f.name for f in fields(ParsedRFQ)}
+        assert set(d['line_items'][0]) == {f.name for f in fields(LineItem)}
+        assert set(d['contact_info']) == {f.name for f in fields(ContactInfo)}
+        assert set(d['company_info']) == {f.name for f in fields(CompanyInfo)}
+    
+    def test_uses_slots(self):
+        rfq = ParsedRFQ(raw_text="Test")
+        assert not hasattr(rfq, '__dict__')
+        with pytest.raises(AttributeError):
+            rfq.not_a_field = 1
+    
+    def test_to_dict_copies_containers(self):
+        rfq = ParsedRFQ(raw_text="Test", parsing_notes=["a"], additional_terms={"k": 1})
+        d = rfq.to_dict()
+        d['parsing_notes'].append("b")
+        d['additional_terms']['k'] = 2
+        assert rfq.parsing_notes == ["a"]
+        assert rfq.additional_terms == {"k": 1}
+    
+    def test_copy(self):
+        rfq = ParsedRFQ(
+            raw_text="Test",
+            direction=Direction.SELL,
+            parsing_notes=["a"],
+            line_items=[LineItem(item_number=1)],
+        )
+        clone = rfq.copy()
+        assert clone == rfq
+        clone.parsing_notes.append("b")
+        clone.line_items.append(LineItem(item_number=2))
+        assert rfq.parsing_notes == ["a"]
+        assert len(rfq.line_items) == 1
+    
     def test_to_json(self):
         rfq = ParsedRFQ(
             raw_text="Test",
@@ -349,6 +404,27 @@ class TestMockMistralClient:
         mock.complete(model="test", messages=[{"role": "user", "content": "test"}])
         assert mock.get_call_count() == 1
     
+    def test_default_response_is_per_client(self):
+        first = MockMistralClient()
+        second = MockMistralClient()
+        first.default_response["direction"] = "SELL"
+        assert second.default_response["direction"] == "BUY"
+        assert _DEFAULT_RFQ_RESPONSE["direction"] == "BUY"
+        with pytest.raises(TypeError):
+            _DEFAULT_RFQ_RESPONSE["direction"] = "SELL"
+    
+    def test_parse_rfq_returns_a_copy(self):
+        mock = MockMistralClient()
+        result = mock.parse_rfq("hello there")
+        assert result is not mock.default_response
+        assert result["parsing_notes"] == ["Parsed by MockMistralClient"]
+        result["direction"] = "SELL"
+        result["parsing_notes"].append("edited by caller")
+        again = mock.parse_rfq("hello there")
+        assert again["direction"] == "BUY"
+        assert again["parsing_notes"] == ["Parsed by MockMistralClient"]
+        assert mock.parse_rfq("Sell 5MM GBPUSD")["parsing_notes"] == ["Parsed by MockMistralClient"]
+    
     def test_parse_rfq_method(self):
         mock = MockMistralClient()
         result = mock.parse_rfq("Buy 10MM EURUSD")
@@ -479,6 +555,24 @@ class TestRFQParserRegex:
         result = parser.parse("EURUSD price please")
         assert result.direction == Direction.UNKNOWN
     
+    def test_keywords_match_whole_words_only(self, parser):
+        result = parser.parse("Let me know the first EURUSD level")
+        assert result.urgency == Urgency.NORMAL
+        assert result.asset_class == AssetClass.FX_SPOT
+    
+    def test_keyword_inflections(self, parser):
+        assert parser.parse("Client buying 10MM EURUSD").direction == Direction.BUY
+        assert parser.parse("Client selling 10MM EURUSD").direction == Direction.SELL
+        assert parser.parse("Client offering 10MM EURUSD").direction == Direction.SELL
+        assert parser.parse("Bidding 10MM EURUSD").direction == Direction.BUY
+        assert parser.parse("Buy-side wants 10MM EURUSD").direction == Direction.BUY
+        assert parser.parse("Need EURUSD 10MM by closing").urgency == Urgency.EOD
+    
+    def test_hyphenated_keywords(self, parser):
+        assert parser.parse("5Y USD-IRS receive 10MM").asset_class == AssetClass.IRS
+        assert parser.parse("Two-way 10MM EURUSD").direction == Direction.TWO_WAY
+        assert parser.parse("2-way 10MM EURUSD").direction == Direction.TWO_WAY
+    
     # Amount tests
     def test_amount_millions_mm(self, parser):
         result = parser.parse("Buy 10MM EURUSD")
@@ -518,12 +612,31 @@ class TestRFQParserRegex:
         assert result.currency_pair == "EUR/USD"
         assert result.instrument == "EURUSD"
     
+    def test_currency_pair_with_space(self, parser):
+        result = parser.parse("Buy EUR USD 10MM")
+        assert result.currency_pair == "EUR/USD"
+    
+    def test_currency_pair_skips_same_currency(self, parser):
+        result = parser.parse("Buy USD USD/JPY 10MM")
+        assert result.currency_pair == "USD/JPY"
+    
+    def test_currency_pair_leftmost_wins(self, parser):
+        result = parser.parse("Buy USDJPY vs EURUSD")
+        assert result.currency_pair == "USD/JPY"
+    
     def test_various_currency_pairs(self, parser):
         pairs = ["GBPUSD", "USDJPY", "AUDUSD", "USDCAD", "USDCHF"]
         for pair in pairs:
             result = parser.parse(f"Buy 10MM {pair}")
             assert result.instrument == pair
     
+    def test_currency_pair_strings_shared(self, parser):
+        first = parser.parse("Buy 10MM EURUSD")
+        second = parser.parse("Sell 5MM eur/usd")
+        assert first.currency_pair == "EUR/USD"
+        assert first.currency_pair is second.currency_pair
+        assert first.instrument is second.instrument
+    
     # Tenor tests
     def test_tenor_months(self, parser):
         result = parser.parse("Buy EURUSD 3M forward")
@@ -604,6 +717,23 @@ class TestRFQParserRegex:
         assert result.asset_class == AssetClass.FX_FORWARD
 
 
+class TestParseQuantity:
+    """Test the quantity helper used by the regex parser"""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("10MM", (10_000_000, "MM")),
+        ("5m", (5_000_000, "M")),
+        ("100 MIO", (100_000_000, "MIO")),
+        ("2.5BN", (2_500_000_000, "BN")),
+        ("750", (750, "")),
+    ])
+    def test_units(self, text, expected):
+        assert _parse_quantity(text) == expected
+    
+    def test_no_amount(self):
+        assert _parse_quantity("buy eur/usd") is None
+
+
 # =============================================================================
 # PARSER WITH MOCK CLIENT TESTS
 # =============================================================================
@@ -611,6 +741,160 @@ class TestRFQParserRegex:
 class TestRFQParserWithMock:
     """Test RFQParser with injected MockMistralClient"""
     
+    def test_llm_timeout_passed_to_client(self):
+        mock = MockMistralClient()
+        seen = {}
+        complete = mock.complete
+        def recording_complete(model, messages, **kwargs):
+            seen.update(kwargs)
+            return complete(model, messages, **kwargs)
+        mock.complete = recording_complete
+        RFQParser(client=mock, use_llm=True, config=ParserConfig(llm_timeout=2.5)).parse("Buy 10MM EURUSD")
+        assert seen['timeout_ms'] == 2500
+    
+    def test_empty_input_skips_llm(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        for text in ("", "   \n"):
+            result = parser.parse(text)
+            assert result.raw_text == ""
+            assert result.confidence_score == 0.0
+        assert parser.parse_coalesced(" ").direction == Direction.UNKNOWN
+        assert mock.call_count == 0
+    
+    def test_timeout_retried_once(self):
+        class SlowOnceClient(MockMistralClient):
+            def complete(self, model, messages, **kwargs):
+                if self.call_count == 0:
+                    self._record_call(model, messages)
+                    raise TimeoutError("read timed out")
+                return super().complete(model, messages, **kwargs)
+        mock = SlowOnceClient()
+        result = RFQParser(client=mock, use_llm=True).parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2
+        assert result.direction == Direction.SELL
+        assert "Parsed by MockMistralClient" in result.parsing_notes
+    
+    def test_repeated_timeout_falls_back_to_regex(self):
+        class AlwaysSlowClient(MockMistralClient):
+            def complete(self, model, messages, **kwargs):
+                self._record_call(model, messages)
+                raise TimeoutError("read timed out")
+        mock = AlwaysSlowClient()
+        result = RFQParser(client=mock, use_llm=True).parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2
+        assert any("LLM parsing failed" in note for note in result.parsing_notes)
+    
+    def test_timeout_named_errors_are_not_retried(self):
+        class TimeoutPolicyError(Exception):
+            pass
+        class PolicyClient(MockMistralClient):
+            def complete(self, model, messages, **kwargs):
+                self._record_call(model, messages)
+                raise TimeoutPolicyError("rejected")
+        mock = PolicyClient()
+        RFQParser(client=mock, use_llm=True).parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 1
+    
+    def test_httpx_timeout_retried(self):
+        httpx = pytest.importorskip("httpx")
+        class HttpxSlowOnceClient(MockMistralClient):
+            def complete(self, model, messages, **kwargs):
+                if self.call_count == 0:
+                    self._record_call(model, messages)
+                    raise httpx.ReadTimeout("read timed out")
+                return super().complete(model, messages, **kwargs)
+        mock = HttpxSlowOnceClient()
+        RFQParser(client=mock, use_llm=True).parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2
+    
+    def test_compact_prompt_by_default(self):
+        mock = MockMistralClient()
+        RFQParser(client=mock, use_llm=True).parse("Buy 10MM EURUSD")
+        assert mock.get_last_call()['messages'][0]['content'] == RFQParser.SYSTEM_PROMPT_COMPACT
+    
+    def test_schema_miss_retries_with_verbose_prompt(self):
+        class CompactMissClient(MockMistralClient):
+            def complete(self, model, messages, **kwargs):
+                if messages[0]['content'] == RFQParser.SYSTEM_PROMPT_COMPACT:
+                    self._record_call(model, messages)
+                    return MockResponse.from_content('{"notes": "unsure"}')
+                return super().complete(model, messages, **kwargs)
+        mock = CompactMissClient()
+        result = RFQParser(client=mock, use_llm=True).parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2
+        assert mock.get_last_call()['messages'][0]['content'] == RFQParser.SYSTEM_PROMPT
+        assert result.direction == Direction.SELL
+    
+    def test_parse_stream(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        tokens = []
+        result = parser.parse_stream("Sell 5MM GBPUSD", on_token=tokens.append)
+        assert result.direction == Direction.SELL
+        assert result.currency_pair == "GBP/USD"
+        assert len(tokens) > 1
+        assert json.loads("".join(tokens))["direction"] == "SELL"
+        assert mock.call_count == 1
+    
+    def test_parse_stream_stops_at_closing_brace(self):
+        class TrailingStreamClient(MockMistralClient):
+            def stream(self, model, messages, **kwargs):
+                yield MockStreamEvent.from_delta('{"direction": "BUY", "parsing_notes": ["a}"]}')
+                yield MockStreamEvent.from_delta(' trailing {')
+        tokens = []
+        result = RFQParser(client=TrailingStreamClient(), use_llm=True).parse_stream(
+            "Buy 10MM EURUSD", on_token=tokens.append
+        )
+        assert result.direction == Direction.BUY
+        assert "".join(tokens).endswith("]}")
+    
+    def test_parse_stream_shares_parse_pipeline(self):
+        class CompactMissClient(MockMistralClient):
+            def complete(self, model, messages, *args, **kwargs):
+                if messages[0]['content'] == RFQParser.SYSTEM_PROMPT_COMPACT:
+                    self._record_call(model, messages)
+                    return MockResponse.from_content('{"notes": "unsure"}')
+                return super().complete(model, messages, *args, **kwargs)
+        mock = CompactMissClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        assert parser.parse_stream("  ").raw_text == ""
+        assert mock.call_count == 0
+        tokens = []
+        resets = []
+        streamed = parser.parse_stream(
+            "Sell 5MM GBPUSD",
+            on_token=tokens.append,
+            on_reset=lambda: (resets.append("".join(tokens)), tokens.clear()),
+        )
+        assert mock.call_count == 2  # Compact miss, then the verbose prompt
+        assert resets == ['{"notes": "unsure"}']  # The compact miss was streamed, then dropped
+        assert json.loads("".join(tokens))['direction'] == 'SELL'
+        assert streamed.direction == Direction.SELL
+        assert "Parsed by MockMistralClient" in streamed.parsing_notes
+        parsed = parser.parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2  # Served from the cache parse_stream filled
+        assert parsed.to_dict() | {'rfq_id': None, 'timestamp': None} == \
+            streamed.to_dict() | {'rfq_id': None, 'timestamp': None}
+    
+    def test_parse_stream_without_llm(self):
+        result = RFQParser(use_llm=False).parse_stream("Buy 10MM EURUSD")
+        assert "Parsed using regex fallback (no LLM)" in result.parsing_notes
+    
+    def test_parsers_share_mistral_client_per_key(self, monkeypatch):
+        import rfq_parser
+        monkeypatch.setattr(rfq_parser, "MISTRAL_AVAILABLE", True)
+        monkeypatch.setattr(rfq_parser, "Mistral", lambda api_key, **kwargs: MockMistralClient())
+        _get_mistral_client.cache_clear()
+        try:
+            first = RFQParser(api_key="key-a")
+            second = RFQParser(api_key="key-a")
+            other = RFQParser(api_key="key-b")
+            assert first.client is second.client
+            assert other.client is not first.client
+        finally:
+            _get_mistral_client.cache_clear()
+    
     def test_parser_with_mock_client(self):
         mock = MockMistralClient()
         parser = RFQParser(client=mock, use_llm=True)
@@ -661,6 +945,32 @@ class TestBatchParsing:
         assert results[1].direction == Direction.SELL
         assert results[2].direction == Direction.TWO_WAY
     
+    def test_parse_cache_skips_repeat_llm_calls(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        first = parser.parse("Sell 5MM GBPUSD")
+        first.parsing_notes.append("edited by caller")
+        second = parser.parse("  Sell 5MM GBPUSD ")
+        assert mock.call_count == 1
+        assert second.direction == Direction.SELL
+        assert "edited by caller" not in second.parsing_notes
+        assert second.rfq_id != first.rfq_id
+        parser.clear_cache()
+        parser.parse("Sell 5MM GBPUSD")
+        assert mock.call_count == 2
+    
+    def test_parse_cache_evicts_and_can_be_disabled(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True, config=ParserConfig(cache_size=1))
+        parser.parse("Buy 1MM EURUSD")
+        parser.parse("Buy 2MM EURUSD")
+        parser.parse("Buy 1MM EURUSD")
+        assert mock.call_count == 3
+        uncached = RFQParser(client=MockMistralClient(), use_llm=True, config=ParserConfig(cache_size=0))
+        uncached.parse("Buy 1MM EURUSD")
+        uncached.parse("Buy 1MM EURUSD")
+        assert uncached.client.call_count == 2
+    
     def test_parse_batch_empty_list(self):
         parser = RFQParser(use_llm=False)
         results = parser.parse_batch([])
@@ -670,6 +980,251 @@ class TestBatchParsing:
         parser = RFQParser(use_llm=False)
         results = parser.parse_batch(["Buy 10MM EURUSD"])
         assert len(results) == 1
+    
+    def test_parse_batch_shares_timestamp(self):
+        parser = RFQParser(use_llm=False)
+        results = parser.parse_batch(["Buy 10MM EURUSD", "Sell 5MM GBPUSD"])
+        assert results[0].timestamp == results[1].timestamp
+    
+    def test_parse_batch_concurrent_llm(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        texts = [f"{side} {n}MM GBPUSD" for n in range(1, 7) for side in ("Sell", "Buy")]
+        results = parser.parse_batch(texts, max_workers=4)
+        assert [r.raw_text for r in results] == texts
+        assert results[0].direction == Direction.SELL
+        assert results[1].direction == Direction.BUY
+        assert len({r.timestamp for r in results}) == 1
+        assert mock.call_count == len(texts)
+        assert len(mock.call_history) == len(texts)
+    
+    def test_iter_parse_batch_yields_in_order(self):
+        parser = RFQParser(client=MockMistralClient(), use_llm=True)
+        texts = ["Buy 10MM EURUSD", "Sell 5MM GBPUSD", "Two-way on USDJPY"]
+        assert [r.raw_text for r in parser.iter_parse_batch(texts, max_workers=3)] == texts
+    
+    def test_batch_timestamp_context(self):
+        with batch_timestamp():
+            first = ParsedRFQ(raw_text="a")
+            second = ParsedRFQ(raw_text="b")
+        assert first.timestamp == second.timestamp
+        # Cleared on exit
+        with batch_timestamp():
+            inner = ParsedRFQ(raw_text="c")
+        assert _batch_timestamp.get() is None
+        assert inner.timestamp
+
+    def test_freeze_time(self):
+        with freeze_time("2024-01-01T00:00:00"):
+            rfq = ParsedRFQ(raw_text="a")
+            result = RFQParser(use_llm=False).parse("Buy 10MM EURUSD")
+        assert rfq.timestamp == "2024-01-01T00:00:00"
+        assert result.timestamp == "2024-01-01T00:00:00"
+        assert _batch_timestamp.get() is None
+
+    def test_now_provider_override(self, monkeypatch):
+        import rfq_parser
+        monkeypatch.setattr(rfq_parser, "_now_provider", lambda: "2024-01-01T00:00:00")
+        assert ParsedRFQ(raw_text="a").timestamp == "2024-01-01T00:00:00"
+        with batch_timestamp():
+            assert ParsedRFQ(raw_text="b").timestamp == "2024-01-01T00:00:00"
+
+
+class MarshalingMockClient(MockMistralClient):
+    """MockMistralClient that answers numbered multi-RFQ prompts with an rfqs array"""
+
+    def complete(self, model, messages, **kwargs):
+        content = messages[-1]['content']
+        if not content.startswith("Parse each of these"):
+            return super().complete(model, messages, **kwargs)
+        self._record_call(model, messages)
+        rfqs = []
+        for line in content.split("\n\n", 1)[1].splitlines():
+            number, text = line.split(") ", 1)
+            rfqs.append(dict(self._get_response_for_rfq(text), index=int(number)))
+        return MockResponse.from_content(json.dumps({"rfqs": rfqs}))
+
+
+class TestMarshaledParsing:
+    """Test parse_marshaled (several RFQs per LLM call)"""
+
+    def test_parse_coalesced_fuses_concurrent_calls(self):
+        import threading
+        mock = MarshalingMockClient()
+        parser = RFQParser(client=mock, use_llm=True,
+                           config=ParserConfig(coalesce_window=0.5, coalesce_max_batch=4))
+        texts = ["Buy 10MM EURUSD", "Sell 5MM GBPUSD", "Two-way on USDJPY", "Sell 1MM AUDUSD"]
+        results = {}
+        threads = [
+            threading.Thread(target=lambda t=t: results.__setitem__(t, parser.parse_coalesced(t)))
+            for t in texts
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert mock.call_count == 1
+        assert results["Sell 5MM GBPUSD"].direction == Direction.SELL
+        assert results["Two-way on USDJPY"].raw_text == "Two-way on USDJPY"
+
+    def test_close_stops_coalescer_worker(self):
+        parser = RFQParser(client=MarshalingMockClient(), use_llm=True,
+                           config=ParserConfig(coalesce_window=0.01))
+        parser.parse_coalesced("Buy 10MM EURUSD")
+        worker = parser._coalescer._worker
+        parser.close()
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+        # A closed parser starts a fresh worker on demand
+        assert parser.parse_coalesced("Sell 5MM GBPUSD").direction == Direction.SELL
+        parser.close()
+
+    def test_dropped_parser_is_collected_and_worker_stops(self):
+        import gc
+        import weakref
+        parser = RFQParser(client=MarshalingMockClient(), use_llm=True,
+                           config=ParserConfig(coalesce_window=0.01))
+        parser.parse_coalesced("Buy 10MM EURUSD")
+        worker = parser._coalescer._worker
+        parser_ref = weakref.ref(parser)
+        del parser
+        gc.collect()
+        assert parser_ref() is None
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+
+    def test_marshaled_uses_parse_cache(self):
+        mock = MarshalingMockClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        parser.parse("Buy 10MM EURUSD")
+        results = parser.parse_marshaled(["Buy 10MM EURUSD", "Sell 5MM GBPUSD", "Two-way on USDJPY"])
+        assert mock.call_count == 2
+        assert "Parse each of these 2 RFQs" in mock.call_history[-1]['messages'][-1]['content']
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL, Direction.TWO_WAY]
+        parser.parse("Two-way on USDJPY")
+        assert mock.call_count == 2
+
+    def test_parse_coalesced_without_llm(self):
+        parser = RFQParser(use_llm=False)
+        assert parser.parse_coalesced("Buy 10MM EURUSD").direction == Direction.BUY
+
+    def test_one_call_per_group(self):
+        mock = MarshalingMockClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        rfqs = ["Buy 10MM EURUSD", "Sell 5MM GBPUSD", "Two-way on USDJPY"]
+        results = parser.parse_marshaled(rfqs, group_size=2)
+        assert mock.call_count == 2
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL, Direction.TWO_WAY]
+        assert results[1].raw_text == "Sell 5MM GBPUSD"
+
+    def test_unmarshaled_response_falls_back_to_single_parses(self):
+        mock = MockMistralClient()  # Always answers with a single RFQ object
+        parser = RFQParser(client=mock, use_llm=True)
+        results = parser.parse_marshaled(["Buy 10MM EURUSD", "Sell 5MM GBPUSD"])
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL]
+        assert mock.call_count == 3
+
+    def test_regex_mode_uses_parse_batch(self):
+        parser = RFQParser(use_llm=False)
+        results = parser.parse_marshaled(["Buy 10MM EURUSD", "Sell 5MM GBPUSD"])
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL]
+
+
+class FakeBatchClient:
+    """Minimal stand-in for the Mistral files/batch APIs"""
+
+    def __init__(self, job_status="SUCCESS", skip_ids=(), corrupt_ids=()):
+        self.job_status = job_status
+        self.skip_ids = set(skip_ids)
+        self.corrupt_ids = set(corrupt_ids)
+        self.uploaded = None
+        self.files = SimpleNamespace(upload=self._upload, download=self._download)
+        self.batch = SimpleNamespace(jobs=SimpleNamespace(
+            create=self._create, get=self._get, cancel=lambda job_id: None
+        ))
+
+    def _upload(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = file["content"].decode("utf-8")
+        return SimpleNamespace(id="file-in")
+
+    def _create(self, input_files, model, endpoint, metadata=None):
+        return SimpleNamespace(id="job-1", status="QUEUED", output_file=None, completed_requests=0)
+
+    def _get(self, job_id):
+        return SimpleNamespace(id=job_id, status=self.job_status, output_file="file-out", completed_requests=1)
+
+    def _download(self, file_id):
+        mock = MockMistralClient()
+        lines = []
+        for line in self.uploaded.splitlines():
+            request = json.loads(line)
+            if request["custom_id"] in self.skip_ids:
+                continue
+            if request["custom_id"] in self.corrupt_ids:
+                lines.append('{"custom_id": "%s", "response": {' % request["custom_id"])
+                continue
+            rfq_text = request["body"]["messages"][-1]["content"]
+            content = json.dumps(mock.parse_rfq(rfq_text))
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}
+            }))
+        return SimpleNamespace(read=lambda: "\n".join(lines).encode("utf-8"))
+
+
+class TestBatchAPIParsing:
+    """Test parse_batch_via_mistral_api"""
+
+    def test_results_mapped_back_in_order(self):
+        parser = RFQParser(client=FakeBatchClient(), use_llm=True)
+        results = parser.parse_batch_via_mistral_api(
+            ["Buy 10MM EURUSD", "Sell 5MM GBPUSD"], poll_interval=0
+        )
+        assert len(results) == 2
+        assert results[0].direction == Direction.BUY
+        assert results[1].direction == Direction.SELL
+        assert results[1].currency_pair == "GBP/USD"
+
+    def test_missing_result_falls_back_to_regex(self):
+        parser = RFQParser(client=FakeBatchClient(skip_ids={"1"}), use_llm=True)
+        results = parser.parse_batch_via_mistral_api(
+            ["Buy 10MM EURUSD", "Sell 5MM GBPUSD"], poll_interval=0
+        )
+        assert results[1].direction == Direction.SELL
+        assert any("Batch API" in note for note in results[1].parsing_notes)
+
+    def test_corrupt_line_only_loses_its_own_result(self):
+        parser = RFQParser(client=FakeBatchClient(corrupt_ids={"1"}), use_llm=True)
+        results = parser.parse_batch_via_mistral_api(
+            ["Buy 10MM EURUSD", "Sell 5MM GBPUSD", "Buy 3MM USDJPY"], poll_interval=0
+        )
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL, Direction.BUY]
+        assert any("Batch API" in note for note in results[1].parsing_notes)
+        assert not any("Batch API" in note for note in results[0].parsing_notes)
+        assert not any("Batch API" in note for note in results[2].parsing_notes)
+
+    def test_failed_job_falls_back_to_regex(self):
+        parser = RFQParser(client=FakeBatchClient(job_status="FAILED"), use_llm=True)
+        results = parser.parse_batch_via_mistral_api(["Buy 10MM EURUSD"], poll_interval=0)
+        assert results[0].direction == Direction.BUY
+        assert any("FAILED" in note for note in results[0].parsing_notes)
+
+    def test_progress_callback_reports_completion(self):
+        parser = RFQParser(client=FakeBatchClient(), use_llm=True)
+        calls = []
+        parser.parse_batch_via_mistral_api(
+            ["Buy 10MM EURUSD"], poll_interval=0,
+            progress_callback=lambda done, total: calls.append((done, total))
+        )
+        assert calls[-1] == (1, 1)
+
+    def test_client_without_batch_api_uses_parse_batch(self):
+        mock = MockMistralClient()
+        parser = RFQParser(client=mock, use_llm=True)
+        results = parser.parse_batch_via_mistral_api(["Buy 10MM EURUSD", "Sell 5MM GBPUSD"])
+        assert [r.direction for r in results] == [Direction.BUY, Direction.SELL]
+        assert mock.call_count == 2
 
 
 # =============================================================================
@@ -688,6 +1243,13 @@ class TestConvenienceFunction:
         result = parse_rfq("Sell 5MM GBPUSD")
         assert result.direction == Direction.SELL
         assert result.currency_pair == "GBP/USD"
+    
+    def test_parse_rfq_reuses_parser(self):
+        from rfq_parser import _shared_parser
+        parse_rfq("Buy 10MM EURUSD")
+        hits = _shared_parser.cache_info().hits
+        parse_rfq("Sell 5MM GBPUSD")
+        assert _shared_parser.cache_info().hits == hits + 1
 
 
 # =============================================================================
@@ -715,6 +1277,44 @@ class TestSerialization:
         
         assert parsed['direction'] == 'BUY'
     
+    def test_to_json_matches_to_dict(self):
+        result = RFQParser(use_llm=False).parse("Sell 5MM GBPUSD 3M urgent")
+        result.line_items = [LineItem(instrument="GBPUSD", direction=Direction.SELL)]
+        result.contact_info = ContactInfo(name="Jane")
+        
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert json.loads(result.to_json(indent=4)) == result.to_dict()
+    
+    def test_to_json_orjson_parity(self):
+        pytest.importorskip("orjson")
+        rfq = ParsedRFQ(
+            raw_text="Buy €10MM EUR/GBP, £ leg",
+            direction=Direction.BUY,
+            quantity=0.1 + 0.2,
+            parsing_notes=["Montant en €"],
+        )
+        assert json.loads(rfq.to_json()) == json.loads(json.dumps(rfq.to_dict(), indent=2))
+        
+        # orjson rejects these; to_json falls back to json
+        rfq.additional_terms = {"ref": 2 ** 70, 1: "non-str key"}
+        assert json.loads(rfq.to_json()) == json.loads(json.dumps(rfq.to_dict(), indent=2))
+    
+    def test_to_json_output_independent_of_orjson(self, monkeypatch):
+        import rfq_parser
+        rfq = ParsedRFQ(
+            raw_text="Buy €10MM EUR/GBP, £ leg",
+            quantity=0.1 + 0.2,
+            strike=float("nan"),
+            parsing_notes=["Montant en €"],
+        )
+        default = rfq.to_json()
+        monkeypatch.setattr(rfq_parser, "orjson", None)
+        plain = rfq.to_json()
+        
+        assert plain == default
+        assert "Buy €10MM EUR/GBP, £ leg" in plain
+        assert json.loads(plain)["strike"] is None
+    
     def test_line_item_serialization(self):
         item = LineItem(
             instrument="EURUSD",
@@ -765,6 +1365,12 @@ class TestParserInitialization:
         parser = RFQParser(client=mock)
         assert parser.client == mock
 
+    def test_uses_slots(self):
+        parser = RFQParser(use_llm=False)
+        assert not hasattr(parser, '__dict__')
+        with pytest.raises(AttributeError):
+            parser.not_an_attribute = 1
+
 
 # =============================================================================
 # REAL-WORLD RFQ EXAMPLES
@@ -818,10 +1424,10 @@ class TestPerformance:
         import time
         parser = RFQParser(use_llm=False)
         
-        start = time.time()
+        start = time.perf_counter_ns()
         for _ in range(100):
             parser.parse("Buy 10MM EURUSD spot")
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         
         # Should parse 100 RFQs in under 1 second
         assert elapsed < 1.0, f"Parsing too slow: {elapsed:.2f}s for 100 RFQs"
@@ -832,6 +1438,19 @@ class TestPerformance:
         
         results = parser.parse_batch(rfqs)
         assert len(results) == 50
+    
+    def test_long_digit_run_is_linear(self):
+        import time
+        parser = RFQParser(use_llm=False)
+        text = "1" * 20000 + "x"
+        
+        start = time.perf_counter_ns()
+        parser.parse(text)
+        MockMistralClient().complete("mock", [{"role": "user", "content": text}])
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        
+        # Backtracking from every digit offset took ~50s here
+        assert elapsed < 1.0, f"Parsing too slow: {elapsed:.2f}s for a 20k-digit RFQ"
 
 
 # =============================================================================
@@ -100,11 +100,12 @@ setup(
     cmdclass={"build_ext": CMakeBuild},
 
     # Python version requirement
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 
     # Dependencies
     install_requires=[
         "streamlit>=1.28.0",
+        "pandas>=1.5.0",
         "mistralai>=0.0.7",
         "python-dotenv>=1.0.0",
     ],
@@ -120,6 +121,10 @@ setup(
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "httpx[http2]",
+        ],
     },
 
     # Classifiers
@@ -128,8 +133,6 @@ setup(
         "Intended Audience :: Financial and Insurance Industry",
         "Topic :: Office/Business :: Financial",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: C++",